@@ -0,0 +1,74 @@
+"""Module that defines a bridge letting synchronous sorts await comparisons on an event loop.
+
+The sort runs in a worker thread, its comparisons are submitted to the event loop
+and the worker thread blocks until the awaited result is available.
+Batches of independent comparisons (see zigzag_pairing for the oracle interface)
+are awaited concurrently using asyncio.gather, optionally limited by a semaphore.
+"""
+
+import asyncio
+from functools import total_ordering
+
+from pep_3140 import List
+
+
+class AsyncComparisonBridge(object):
+    """Submits comparisons of AsyncBridgedWrapper objects to an async less-than on the event loop."""
+
+    def __init__(self, loop, async_less_than, concurrency_limit=None):
+        """Initialize, must be called from a coroutine running on the loop."""
+        self.loop = loop
+        self.async_less_than = async_less_than
+        self.semaphore = None if concurrency_limit is None else asyncio.Semaphore(concurrency_limit)
+
+    async def compare(self, left, right):
+        """Return whether left wrapper is less than right, equal values are ordered by index."""
+        if left.value == right.value:
+            return left.index < right.index
+        if self.semaphore is None:
+            return await self.async_less_than(left.value, right.value)
+        async with self.semaphore:
+            return await self.async_less_than(left.value, right.value)
+
+    async def compare_all(self, pairs):
+        """Return List of comparison results of (left, right) Tuples, awaited concurrently."""
+        return List(await asyncio.gather(*[self.compare(left, right) for left, right in pairs]))
+
+    def less_than(self, left, right):
+        """Block the calling (non-loop) thread until comparison on the loop is done, return the result."""
+        return asyncio.run_coroutine_threadsafe(self.compare(left, right), self.loop).result()
+
+    def oracle(self, pairs):
+        """Block the calling (non-loop) thread until comparisons of the batch are done, return the results."""
+        return asyncio.run_coroutine_threadsafe(self.compare_all(pairs), self.loop).result()
+
+
+@total_ordering
+class AsyncBridgedWrapper(object):
+    """A wrapper for values which compares via AsyncComparisonBridge, making any sort stable.
+
+    Equality test and comparison of equal values do not await,
+    as with other wrappers, values are expected to support equality test directly.
+    """
+
+    def __init__(self, value, index, bridge):
+        """Wrap the value, index is used as the tiebreaker."""
+        self.value = value
+        self.index = index
+        self.bridge = bridge
+
+    def __eq__(self, other):
+        """Equality test, no await needed."""
+        return self.value == other.value and self.index == other.index
+
+    def __lt__(self, other):
+        """Less-than test, blocking until the bridge returns the result."""
+        return self.bridge.less_than(self, other)
+
+    def __str__(self):
+        """Return class name followed by string value in parentheses."""
+        return "AsyncBridgedWrapper(" + str(self.value) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "AsyncBridgedWrapper(" + repr(self.value) + ", " + repr(self.index) + ", " + repr(self.bridge) + ")"
@@ -0,0 +1,65 @@
+"""Module that defines sorted() candidates for comparisons given by an async less-than coroutine function.
+
+Each function takes source iterable and async_less_than(left, right) coroutine function,
+and returns new List of sorted items. The sort itself runs in the default executor,
+independent comparisons of a pass are awaited concurrently,
+at most concurrency_limit at a time if the limit is given.
+The results are stable, see AsyncBridgedWrapper.
+"""
+
+import asyncio
+from functools import partial
+
+from async_comparison_bridge import AsyncBridgedWrapper
+from async_comparison_bridge import AsyncComparisonBridge
+from complete_binary_insert import complete_pivot
+from halving_binary_insert import halving_pivot
+from indexed_ford_johnson_sort import indexed_ford_johnson_sort
+from indexed_reordered_ford_johnson_sort import indexed_reordered_ford_johnson_sort
+from mutable_stable_lazy_zigzag_pairing_heap import MutableStableLazyZigzagPairingHeap
+from pep_3140 import List
+from sorted_using_heap import sorted_using_mutable_stable_heap
+
+
+async def async_sorted_using_oracle_sort(oracle_sort, source, async_less_than, concurrency_limit=None):
+    """Wrap items, call oracle_sort(wrapped_source, oracle) in executor, unwrap and return List."""
+    loop = asyncio.get_running_loop()
+    bridge = AsyncComparisonBridge(loop, async_less_than, concurrency_limit)
+    wrapped = List([AsyncBridgedWrapper(value, index, bridge) for index, value in enumerate(source)])
+    result = await loop.run_in_executor(None, oracle_sort, wrapped, bridge.oracle)
+    return List([item.value for item in result])
+
+
+def _heap_oracle_sort(heap_class, source, oracle):
+    """Sort using mutable stable heap constructed with the oracle."""
+    return sorted_using_mutable_stable_heap(partial(heap_class, oracle=oracle), source)
+
+
+async def async_sorted_using_mutable_stable_heap(heap_class, source, async_less_than, concurrency_limit=None):
+    """Put items in heap constructed with batching oracle, create List by popping them."""
+    oracle_sort = partial(_heap_oracle_sort, heap_class)
+    return await async_sorted_using_oracle_sort(oracle_sort, source, async_less_than, concurrency_limit)
+
+
+async def async_cfj_sorted(source, async_less_than, concurrency_limit=None):
+    """Plug complete_pivot into indexed_ford_johnson_sort, awaiting comparisons."""
+    oracle_sort = partial(indexed_ford_johnson_sort, complete_pivot)
+    return await async_sorted_using_oracle_sort(oracle_sort, source, async_less_than, concurrency_limit)
+
+
+async def async_hfj_sorted(source, async_less_than, concurrency_limit=None):
+    """Plug halving_pivot into indexed_ford_johnson_sort, awaiting comparisons."""
+    oracle_sort = partial(indexed_ford_johnson_sort, halving_pivot)
+    return await async_sorted_using_oracle_sort(oracle_sort, source, async_less_than, concurrency_limit)
+
+
+async def async_rfj_sorted(source, async_less_than, concurrency_limit=None):
+    """Plug complete_pivot into indexed_reordered_ford_johnson_sort, awaiting comparisons."""
+    oracle_sort = partial(indexed_reordered_ford_johnson_sort, complete_pivot)
+    return await async_sorted_using_oracle_sort(oracle_sort, source, async_less_than, concurrency_limit)
+
+
+async def async_mslzph_sorted(source, async_less_than, concurrency_limit=None):
+    """Return new List of items, sorted using the mslzp heap, awaiting comparisons."""
+    return await async_sorted_using_mutable_stable_heap(
+        MutableStableLazyZigzagPairingHeap, source, async_less_than, concurrency_limit)
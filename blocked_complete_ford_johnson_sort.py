@@ -0,0 +1,14 @@
+"""Module that defines Ford-Johnson sorting algorithm using complete insertion into BlockedList targets."""
+
+from blocked_list import BlockedList
+from complete_binary_insert import mutating_complete_binary_insert
+from keyed_sorted import keyed_sorted
+from pluggable_ford_johnson_sort import pluggable_ford_johnson_sort
+from stabilize_sorted import stabilize_sorted
+
+
+@keyed_sorted
+@stabilize_sorted
+def bcfj_sorted(source):
+    """Plug complete_binary_insert and BlockedList into pluggable_ford_johnson_sort."""
+    return pluggable_ford_johnson_sort(mutating_complete_binary_insert, source, BlockedList)
@@ -0,0 +1,123 @@
+"""Module that defines BlockedList, a sequence with cheap positional insert.
+
+Inserting into the middle of a plain List moves all later items,
+which makes repeated binary insertion quadratic in data movement.
+BlockedList keeps items in a List of bounded blocks, so insert only moves items within one block.
+Blocks are located by a Fenwick tree over block lengths, rebuilt lazily when blocks are split.
+The block of the last read is cached, as binary insertion reads and then inserts nearby.
+"""
+
+from fenwick_tree import FenwickTree
+from pep_3140 import List
+
+
+class BlockedList(object):
+    """Sequence supporting len(), indexed read and write, iteration, append and positional insert.
+
+    Insert and indexed access cost O(log(n / block_size) + block_size),
+    amortized over the occasional Fenwick tree rebuild after a block split."""
+
+    def __init__(self, iterable=(), block_size=512):
+        """Initialize from iterable, blocks are split when they reach twice the block size."""
+        self.block_size = block_size
+        self.blocks = List()
+        self.length = 0
+        self.tree = None
+        # Block containing the last read index, as binary search reads nearby indexes.
+        self.cached_block = None
+        self.cached_index = 0
+        self.cached_start = 0
+        self.cached_stop = 0
+        for item in iterable:
+            self.append(item)
+
+    def __len__(self):
+        """Return number of items stored."""
+        return self.length
+
+    def __iter__(self):
+        """Iterate over items in order."""
+        for block in self.blocks:
+            yield from block
+
+    def _locate(self, index):
+        """Return block index and offset within block for nonnegative item index below length."""
+        if self.tree is None:
+            self.tree = FenwickTree(len(block) for block in self.blocks)
+        return self.tree.search_offset(index)
+
+    def _normalize(self, index):
+        """Return nonnegative index, raise IndexError if out of range."""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("BlockedList: index out of range.")
+        return index
+
+    def __getitem__(self, index):
+        """Return item at given integer index."""
+        if self.cached_start <= index < self.cached_stop:
+            return self.cached_block[index - self.cached_start]
+        index = self._normalize(index)
+        block_index, offset = self._locate(index)
+        block = self.blocks[block_index]
+        self.cached_block = block
+        self.cached_index = block_index
+        self.cached_start = index - offset
+        self.cached_stop = self.cached_start + len(block)
+        return block[offset]
+
+    def __setitem__(self, index, item):
+        """Replace item at given integer index."""
+        block_index, offset = self._locate(self._normalize(index))
+        self.blocks[block_index][offset] = item
+
+    def insert(self, index, item):
+        """Insert item before index, index is clamped the same way as in list.insert."""
+        if index < 0:
+            index = max(index + self.length, 0)
+        if self.cached_start <= index < self.cached_stop:
+            # Binary search usually ends in the last read block.
+            block_index = self.cached_index
+            offset = index - self.cached_start
+        elif index >= self.length:
+            if not self.blocks:
+                self.blocks.append(List())
+                self.tree = None
+            block_index = len(self.blocks) - 1
+            offset = len(self.blocks[block_index])
+        else:
+            block_index, offset = self._locate(index)
+        block = self.blocks[block_index]
+        block.insert(offset, item)
+        self.length += 1
+        if len(block) >= 2 * self.block_size:
+            self.blocks.insert(block_index + 1, List(block[self.block_size:]))
+            del block[self.block_size:]
+            self.tree = None
+            self.cached_stop = 0
+            return
+        if self.tree is not None:
+            self.tree.add(block_index, 1)
+        if block_index == self.cached_index and self.cached_stop:
+            # Cached block grew, its start is unchanged.
+            self.cached_stop += 1
+        else:
+            self.cached_stop = 0
+
+    def append(self, item):
+        """Insert item at the end."""
+        self.insert(self.length, item)
+
+    def extend(self, iterable):
+        """Append all items from iterable."""
+        for item in iterable:
+            self.append(item)
+
+    def __str__(self):
+        """Return comma+space separated str of items in square brackets."""
+        return "[" + ", ".join(str(item) for item in self) + "]"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "BlockedList(" + repr(List(self)) + ", " + repr(self.block_size) + ")"
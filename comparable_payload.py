@@ -1,12 +1,15 @@
-"""Module that defines ComparablePayload class, useful for overriding comparisons."""
+"""Module that defines ComparablePayload class, useful for overriding comparisons.
 
-from functools import total_ordering
+All rich comparisons are defined directly and __slots__ are used,
+as sorts create many instances and compare them in inner loops.
+"""
 
 
-@total_ordering
 class ComparablePayload(object):
     """Pair of key and payload, comparable by key. Can be used to store sorted pairs."""
 
+    __slots__ = ("key", "payload", "__weakref__")
+
     def __init__(self, key, payload):
         """Wrap key and payload into single object."""
         self.key = key
@@ -16,10 +19,26 @@ class ComparablePayload(object):
         """Equality test, delegating to key equality."""
         return self.key == other.key
 
+    def __ne__(self, other):
+        """Inequality test, delegating to key equality."""
+        return not self.key == other.key
+
     def __lt__(self, other):
         """Less-than test, delegating to key comparison."""
         return self.key < other.key
 
+    def __le__(self, other):
+        """Less-or-equal test, delegating to key less-than."""
+        return not other.key < self.key
+
+    def __gt__(self, other):
+        """Greater-than test, delegating to key less-than."""
+        return other.key < self.key
+
+    def __ge__(self, other):
+        """Greater-or-equal test, delegating to key less-than."""
+        return not self.key < other.key
+
     def __str__(self):
         """Return class name and key string in parentheses."""
         return "ComparablePayload(" + str(self.key) + ")"
@@ -1,25 +1,49 @@
-"""Module that defines ComparableSecondary class, useful for making sort algorithms stable."""
+"""Module that defines ComparableSecondary class, useful for making sort algorithms stable.
 
-from functools import total_ordering
+All rich comparisons are defined directly and __slots__ are used,
+as stabilize_sorted creates an instance per sorted item.
+Every comparison calls key less-than exactly once, in the same orientation,
+and key equality only if the keys are not less, so the secondaries are compared only when needed.
+"""
 
 
-@total_ordering
 class ComparableSecondary(object):
     """Pair of key and secondary, comparable by key and if equal then by secondary."""
 
+    __slots__ = ("key", "secondary", "__weakref__")
+
     def __init__(self, key, secondary):
         """Wrap key and secondary into a sigle object."""
         self.key = key
         self.secondary = secondary
 
     def __eq__(self, other):
-        """Equality test, test secondaries only if keys are the same.."""
-        return False if (self.key == other.key) else (self.secondary == other.secondary)
+        """Equality test, test secondaries only if keys are the same."""
+        return (self.key == other.key) and (self.secondary == other.secondary)
 
     def __lt__(self, other):
-        """Less-than test, test secondaries only if keys are the same."""
-        keys_inequal = not (self.key == other.key)
-        return (self.key < other.key) if not (self.key == other.key) else (self.secondary < other.secondary)
+        """Less-than test, test key equality and secondaries only if keys are not less."""
+        if self.key < other.key:
+            return True
+        return (self.secondary < other.secondary) if (self.key == other.key) else False
+
+    def __le__(self, other):
+        """Less-or-equal test, test key equality and secondaries only if keys are not less."""
+        if self.key < other.key:
+            return True
+        return (self.secondary <= other.secondary) if (self.key == other.key) else False
+
+    def __gt__(self, other):
+        """Greater-than test, test key equality and secondaries only if keys are not less."""
+        if self.key < other.key:
+            return False
+        return (self.secondary > other.secondary) if (self.key == other.key) else True
+
+    def __ge__(self, other):
+        """Greater-or-equal test, test key equality and secondaries only if keys are not less."""
+        if self.key < other.key:
+            return False
+        return (self.secondary >= other.secondary) if (self.key == other.key) else True
 
     def __str__(self):
         """Return class name followed by string key in parentheses."""
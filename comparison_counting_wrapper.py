@@ -1,15 +1,19 @@
 """Module that defines a wrapper object which counts comparisons.
 
-This uses functools to generate rich comparison functions.
+All rich comparisons are defined directly and __slots__ are used, to keep overhead low.
+Weak references are supported, for weak heaps.
 Equivalence test does not increment counter, as sorts never do
 equal test directly, and with that every comparison increments counter exactly once.
 
 In order to support queues that require hashable items,
 hash function is implemented, and the has value
 does not change with the comparison counter.
+
+Counter increments are protected by a lock, as oracles like ThreadPoolOracle
+evaluate comparisons concurrently and += on an attribute is not atomic.
 """
 
-from functools import total_ordering
+from threading import Lock
 
 
 # TODO: Make sure copy.deepcopy() is supported.
@@ -18,13 +22,20 @@ class SimpleCounter(object):
 
     def __init__(self):
         """Initialization."""
+        self.lock = Lock()
         self.count = 0
 
+    def increment(self):
+        """Add one to the count, safe to call from concurrent threads."""
+        with self.lock:
+            self.count += 1
+
 
-@total_ordering
 class ComparisonCountingWrapper(object):
     """A wrapper for values which counts comparison operations."""
 
+    __slots__ = ("value", "counter", "__weakref__")
+
     def __init__(self, value, counter):
         """Wrap the value using the counter object."""
         self.value = value
@@ -40,9 +51,24 @@ class ComparisonCountingWrapper(object):
 
     def __lt__(self, other):
         """Less-than test, incrementing counter."""
-        self.counter.count += 1
+        self.counter.increment()
         return self.value < other.value
 
+    def __le__(self, other):
+        """Less-or-equal test, incrementing counter."""
+        self.counter.increment()
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        """Greater-than test, incrementing counter."""
+        self.counter.increment()
+        return self.value > other.value
+
+    def __ge__(self, other):
+        """Greater-or-equal test, incrementing counter."""
+        self.counter.increment()
+        return self.value >= other.value
+
     def __str__(self):
         """Return class name followed by string value in parentheses."""
         return "ComparisonCountingWrapper(" + str(self.value) + ")"
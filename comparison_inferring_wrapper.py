@@ -0,0 +1,121 @@
+"""Module that defines a wrapper object which remembers and infers comparison results.
+
+This uses functools to generate rich comparison functions.
+Every less-than result is recorded in a shared store, which keeps it closed under transitivity,
+so a comparison already implied by previous results is answered without comparing wrapped values.
+Relations are stored as bitsets (Python ints) of lesser and greater elements, one pair per wrapper.
+
+Wrapped values which are not equal are assumed to be strictly ordered,
+so false less-than result is recorded as greater-than.
+Equivalence test delegates to wrapped values and is not recorded,
+as sorts never do equal test directly. In order to support queues that require hashable items,
+hash function is implemented, delegating to the wrapped value.
+"""
+
+from functools import total_ordering
+
+from pep_3140 import List
+
+
+class ComparisonStore(object):
+    """Shared store of known less-than relations between wrappers, closed under transitivity.
+
+    Wrappers are identified by ids assigned by the store.
+    Lesser[id] is bitset of ids known to be less, greater[id] of ids known to be greater.
+    Counters of answered (inferred) and delegated comparisons are kept for statistics."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.lesser = List()
+        self.greater = List()
+        self.inferred = 0
+        self.delegated = 0
+
+    def new_id(self):
+        """Return id for a new element, with no known relations."""
+        self.lesser.append(0)
+        self.greater.append(0)
+        return len(self.lesser) - 1
+
+    def known_less_than(self, left_id, right_id):
+        """Return True or False if relation between ids is known, None otherwise."""
+        if (self.greater[left_id] >> right_id) & 1:
+            return True
+        if (self.lesser[left_id] >> right_id) & 1:
+            return False
+        return None
+
+    def record_less_than(self, lesser_id, greater_id):
+        """Record lesser_id < greater_id, together with all relations following by transitivity.
+
+        As relations are already closed, an element greater than greater_id already knows
+        about everything below lesser_id iff it knows about lesser_id, similarly for lesser elements.
+        So only elements gaining new relations are visited.
+        """
+        lesser = self.lesser
+        greater = self.greater
+        lesser_ids = lesser[lesser_id] | (1 << lesser_id)
+        greater_ids = greater[greater_id] | (1 << greater_id)
+        # Compute both sets to visit before updating, as the updates affect them.
+        unaware_greater = greater_ids & ~greater[lesser_id]
+        unaware_lesser = lesser_ids & ~lesser[greater_id]
+        while unaware_greater:
+            lowest = unaware_greater & -unaware_greater
+            lesser[lowest.bit_length() - 1] |= lesser_ids
+            unaware_greater ^= lowest
+        while unaware_lesser:
+            lowest = unaware_lesser & -unaware_lesser
+            greater[lowest.bit_length() - 1] |= greater_ids
+            unaware_lesser ^= lowest
+
+    def __str__(self):
+        """Return class name followed by counters in parentheses."""
+        return "ComparisonStore(inferred " + str(self.inferred) + ", delegated " + str(self.delegated) + ")"
+
+    def __repr__(self):
+        """Return class name followed by sizes and counters in angle brackets, not constructor-like."""
+        return "ComparisonStore(<ids " + repr(len(self.lesser)) + ", inferred " + repr(self.inferred) + ", delegated " + repr(self.delegated) + ">)"
+
+
+@total_ordering
+class ComparisonInferringWrapper(object):
+    """A wrapper for values which compares them only if the result is not known from the store."""
+
+    def __init__(self, value, store):
+        """Wrap the value, obtaining a new id from the store."""
+        self.value = value
+        self.store = store
+        self.ident = store.new_id()
+
+    def __hash__(self):
+        """Return hash of the wrapped value."""
+        return hash(self.value)
+
+    def __eq__(self, other):
+        """Equality test, not recorded."""
+        return self.value == other.value
+
+    def __lt__(self, other):
+        """Less-than test, answered from the store if possible, otherwise delegated and recorded."""
+        store = self.store
+        known = store.known_less_than(self.ident, other.ident)
+        if known is not None:
+            store.inferred += 1
+            return known
+        if self.value == other.value:
+            return False
+        store.delegated += 1
+        result = self.value < other.value
+        if result:
+            store.record_less_than(self.ident, other.ident)
+        else:
+            store.record_less_than(other.ident, self.ident)
+        return result
+
+    def __str__(self):
+        """Return class name followed by string value in parentheses."""
+        return "ComparisonInferringWrapper(" + str(self.value) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "ComparisonInferringWrapper(" + repr(self.value) + ", " + repr(self.store) + ")"
@@ -0,0 +1,150 @@
+"""Module that defines an on-disk journal of comparison results, and a wrapper using it.
+
+The journal is an append-only file of fixed-size records, each holding digests
+of identities of the two compared elements and the less-than result.
+On open, existing records are read through mmap into a dict, a truncated last record
+(from a crash during write) is cut off. Every new record is flushed immediately,
+so a crashed sort loses no answered comparison.
+
+Sorts in this repository are deterministic, so a restarted sort of the same source
+gets the journaled answers replayed and only starts asking at the first unknown comparison.
+Identities have to be stable across runs, by default repr of the wrapped value is used.
+A repr containing a memory address (the default object repr) is rejected,
+values without a stable repr need an explicit identity or identity_function.
+"""
+
+import mmap
+import os
+from functools import total_ordering
+from hashlib import blake2b
+
+from pep_3140 import Dict
+
+DIGEST_SIZE = 16
+RECORD_SIZE = 2 * DIGEST_SIZE + 1
+
+
+def identity_digest(identity):
+    """Return bytes digest of identity string."""
+    return blake2b(identity.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+class ComparisonJournal(object):
+    """Append-only file of less-than results, keyed by pairs of identity digests.
+
+    Can be used as a context manager, closing the file on exit.
+    Counters of replayed and recorded comparisons are kept for statistics.
+    """
+
+    def __init__(self, path, sync=False):
+        """Open or create the journal at path, read existing records. If sync, fsync every record."""
+        self.path = path
+        self.sync = sync
+        self.known = Dict()
+        self.replayed = 0
+        self.recorded = 0
+        self.file = open(path, "a+b")
+        size = os.fstat(self.file.fileno()).st_size
+        complete_size = size - size % RECORD_SIZE
+        if complete_size < size:
+            self.file.truncate(complete_size)
+        if complete_size:
+            with mmap.mmap(self.file.fileno(), complete_size, access=mmap.ACCESS_READ) as mapped:
+                known = self.known
+                for offset in range(0, complete_size, RECORD_SIZE):
+                    known[mapped[offset:offset + 2 * DIGEST_SIZE]] = mapped[offset + 2 * DIGEST_SIZE] == 1
+
+    def __len__(self):
+        """Return number of journaled comparisons."""
+        return len(self.known)
+
+    def known_less_than(self, left_digest, right_digest):
+        """Return True or False if a comparison of the two is journaled (either way), None otherwise."""
+        result = self.known.get(left_digest + right_digest)
+        if result is not None:
+            self.replayed += 1
+            return result
+        result = self.known.get(right_digest + left_digest)
+        if result is not None:
+            # Equal elements are never journaled, so the opposite comparison is answered by negation.
+            self.replayed += 1
+            return not result
+        return None
+
+    def record_less_than(self, left_digest, right_digest, result):
+        """Append the result of left < right to the file and flush it."""
+        key = left_digest + right_digest
+        self.known[key] = result
+        self.recorded += 1
+        self.file.write(key + (b"\x01" if result else b"\x00"))
+        self.file.flush()
+        if self.sync:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        """Close the journal file."""
+        self.file.close()
+
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the journal, do not suppress exceptions."""
+        self.close()
+        return False
+
+    def __str__(self):
+        """Return class name followed by counters in parentheses."""
+        return "ComparisonJournal(replayed " + str(self.replayed) + ", recorded " + str(self.recorded) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "ComparisonJournal(" + repr(self.path) + ", sync=" + repr(self.sync) + ")"
+
+
+@total_ordering
+class JournaledComparisonWrapper(object):
+    """A wrapper for values which replays comparisons from the journal, recording the new ones."""
+
+    def __init__(self, value, journal, identity=None, identity_function=repr):
+        """Wrap the value, identity string defaults to identity_function of the value.
+
+        Raise ValueError if the identity contains a memory address, as that changes between runs.
+        """
+        self.value = value
+        self.journal = journal
+        if identity is None:
+            identity = identity_function(value)
+        if " at 0x" in identity:
+            raise ValueError("JournaledComparisonWrapper: identity " + repr(identity) + " is not stable across runs.")
+        self.identity = identity
+        self.digest = identity_digest(self.identity)
+
+    def __hash__(self):
+        """Return hash of the wrapped value."""
+        return hash(self.value)
+
+    def __eq__(self, other):
+        """Equality test, not journaled."""
+        return self.value == other.value
+
+    def __lt__(self, other):
+        """Less-than test, replayed from the journal if possible, otherwise delegated and recorded."""
+        journal = self.journal
+        known = journal.known_less_than(self.digest, other.digest)
+        if known is not None:
+            return known
+        if self.value == other.value:
+            return False
+        result = self.value < other.value
+        journal.record_less_than(self.digest, other.digest, result)
+        return result
+
+    def __str__(self):
+        """Return class name followed by string value in parentheses."""
+        return "JournaledComparisonWrapper(" + str(self.value) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "JournaledComparisonWrapper(" + repr(self.value) + ", " + repr(self.journal) + ", " + repr(self.identity) + ")"
@@ -1,17 +1,17 @@
 """Module that defines a wrapper object which logs comparisons.
 
-This uses functools to generate rich comparison functions.
+All rich comparisons are defined directly and __slots__ are used, to keep overhead low.
+Weak references are supported, for weak heaps.
 Equivalence test does not log as sorts never do equal test directly,
 and with that every comparison logs exactly once.
 """
 
-from functools import total_ordering
 
-
-@total_ordering
 class ComparisonLoggingWrapper(object):
     """A wrapper for values which logs comparison operations."""
 
+    __slots__ = ("value", "log", "__weakref__")
+
     def __init__(self, value, log):
         """Wrap the value using the log object."""
         self.value = value
@@ -21,14 +21,29 @@ class ComparisonLoggingWrapper(object):
         """Equality test, NOT logging."""
         return self.value == other.value
 
-    def __lt__(self, other):
-        """Less-than test, logging result."""
-        self.log.info("Called less-than on wrapped value: %s", self.value)
+    def _logged(self, other, name, result):
+        """Log operation name, both wrapped values and result, return the result."""
+        self.log.info("Called %s on wrapped value: %s", name, self.value)
         self.log.info("against wrapped value: %s", other.value)
-        result = (self.value < other.value)
         self.log.info("result: %s", result)
         return result
 
+    def __lt__(self, other):
+        """Less-than test, logging result."""
+        return self._logged(other, "less-than", self.value < other.value)
+
+    def __le__(self, other):
+        """Less-or-equal test, logging result."""
+        return self._logged(other, "less-or-equal", self.value <= other.value)
+
+    def __gt__(self, other):
+        """Greater-than test, logging result."""
+        return self._logged(other, "greater-than", self.value > other.value)
+
+    def __ge__(self, other):
+        """Greater-or-equal test, logging result."""
+        return self._logged(other, "greater-or-equal", self.value >= other.value)
+
     def __str__(self):
         """Return class name followed by string value in parentheses."""
         return "ComparisonLoggingWrapper(" + str(self.value) + ")"
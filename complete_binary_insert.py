@@ -1,6 +1,7 @@
 """Module that defines binary insert operation using complete pivoting strategy."""
 
-from pluggable_binary_insert import mutating_pluggable_binary_insert
+from pluggable_binary_insert import cached_pivot_offsets
+from pluggable_binary_insert import mutating_scheduled_binary_insert
 
 
 def complete_pivot(lower_index, upper_index):
@@ -16,7 +17,7 @@ def complete_pivot(lower_index, upper_index):
     """
     spread = upper_index - lower_index
     assert spread >= 2
-    lesser_whole = 1 << (len(bin(spread)) - 3)
+    lesser_whole = 1 << (spread.bit_length() - 1)
     complement_whole = spread - lesser_whole
     if not complement_whole:
         # Full tree. Fairly common, least lucky, but effective case in Ford-Johnson.
@@ -31,5 +32,6 @@ def complete_pivot(lower_index, upper_index):
 
 
 def mutating_complete_binary_insert(element, target, lower_index, upper_index):
-    """Binary insertion using complete_pilot plugged to pluggable_binary_insert."""
-    mutating_pluggable_binary_insert(complete_pivot, element, target, lower_index, upper_index)
+    """Binary insertion using cached complete_pivot schedule plugged to scheduled_binary_insert."""
+    pivot_offsets = cached_pivot_offsets(complete_pivot, upper_index - lower_index)
+    return mutating_scheduled_binary_insert(pivot_offsets, element, target, lower_index, upper_index)
@@ -1,11 +1,13 @@
 """Module that defines Ford-Johnson sorting algorithm using complete insertion."""
 
-from complete_binary_insert import mutating_complete_binary_insert
-from pluggable_ford_johnson_sort import pluggable_ford_johnson_sort
+from complete_binary_insert import complete_pivot
+from indexed_ford_johnson_sort import indexed_ford_johnson_sort
+from keyed_sorted import keyed_sorted
 from stabilize_sorted import stabilize_sorted
 
 
+@keyed_sorted
 @stabilize_sorted
 def cfj_sorted(source):
-    """Plug complete_binary_insert into pluggable_ford_johnson_sort_destructive."""
-    return pluggable_ford_johnson_sort(mutating_complete_binary_insert, source)
+    """Plug complete_pivot into bottom-up indexed_ford_johnson_sort."""
+    return indexed_ford_johnson_sort(complete_pivot, source)
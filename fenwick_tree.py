@@ -0,0 +1,94 @@
+"""Module that defines FenwickTree, a prefix sum structure with cheap point updates."""
+
+from pep_3140 import List
+from pep_3140 import Tuple
+
+
+class FenwickTree(object):
+    """Binary indexed tree over a fixed number of nonnegative integer weights.
+
+    Point update, prefix sum and prefix search all cost O(log n).
+    Internally, the tree is 1-based List with unused zero at index 0."""
+
+    def __init__(self, weights=()):
+        """Initialize from iterable of weights, in linear time."""
+        tree = List([0])
+        tree.extend(weights)
+        len_tree = len(tree)
+        for index in range(1, len_tree):
+            parent = index + (index & -index)
+            if parent < len_tree:
+                tree[parent] += tree[index]
+        self.tree = tree
+
+    def __len__(self):
+        """Return number of weights."""
+        return len(self.tree) - 1
+
+    def copy(self):
+        """Return independent FenwickTree with the same weights, in linear time."""
+        copied = FenwickTree()
+        copied.tree = List(self.tree)
+        return copied
+
+    def add(self, index, delta):
+        """Add delta to weight at 0-based index."""
+        tree = self.tree
+        len_tree = len(tree)
+        index += 1
+        while index < len_tree:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, stop):
+        """Return sum of weights at 0-based indexes below stop."""
+        tree = self.tree
+        result = 0
+        while stop > 0:
+            result += tree[stop]
+            stop &= stop - 1
+        return result
+
+    def search_offset(self, value):
+        """Return Tuple of search(value) and value minus the prefix sum below that index.
+
+        Given a position in the concatenation of weights, this is the covering weight and offset within it.
+        """
+        tree = self.tree
+        len_tree = len(tree)
+        index = 0
+        step = 1 << (len_tree.bit_length() - 1)
+        while step:
+            next_index = index + step
+            if next_index < len_tree and tree[next_index] <= value:
+                index = next_index
+                value -= tree[next_index]
+            step >>= 1
+        return Tuple((index, value))
+
+    def search(self, value):
+        """Return least 0-based index such that prefix_sum(index + 1) > value, or len(self) if none.
+
+        Given a position in the concatenation of weights, this locates the weight covering it.
+        Weights have to be nonnegative for this to work.
+        """
+        tree = self.tree
+        len_tree = len(tree)
+        index = 0
+        step = 1 << (len_tree.bit_length() - 1)
+        while step:
+            next_index = index + step
+            if next_index < len_tree and tree[next_index] <= value:
+                index = next_index
+                value -= tree[next_index]
+            step >>= 1
+        return index
+
+    def __str__(self):
+        """Return class name followed by str of internal List in parentheses."""
+        return "FenwickTree(" + str(self.tree) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        weights = List([self.prefix_sum(index + 1) - self.prefix_sum(index) for index in range(len(self))])
+        return "FenwickTree(" + repr(weights) + ")"
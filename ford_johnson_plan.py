@@ -0,0 +1,99 @@
+"""Module that defines insertion plans for Ford-Johnson sorts, cached by number of pairs.
+
+The plan depends only on length, but Ford-Johnson sorts need it on every recursion level
+and harnesses tend to sort many inputs of the same length.
+Plans are kept in a size-bounded LRU cache, hit and miss statistics
+are available as ford_johnson_plan.cache_info().
+"""
+
+from functools import lru_cache
+
+from fenwick_tree import FenwickTree
+from pep_3140 import Tuple
+
+
+class FordJohnsonPlan(object):
+    """Precomputed insertion plan for given number of pairs. Do not mutate.
+
+    Groups is Tuple of (jacobsthal_previous, jacobsthal_current, leeway) Tuples,
+    ranks of pairs in group are from jacobsthal_previous (inclusive) to jacobsthal_current (exclusive),
+    leeway means the odd element can be inserted before the group without additional cost.
+
+    Anchor_positions is FenwickTree of initial target for all anchors appended,
+    odd slots are anchors by rank and even slots count items inserted just below anchor of the same rank,
+    the last slot counts items inserted above all anchors. Pending has weight 1 for anchors of nonzero rank.
+    Sorts should use copies of the trees.
+    """
+
+    def __init__(self, len_pairs):
+        """Compute the plan."""
+        self.len_pairs = len_pairs
+        groups = []
+        jacobsthal_previous = 1
+        jacobsthal_current = 1
+        while jacobsthal_current < len_pairs:
+            jacobsthal_backup = jacobsthal_previous
+            jacobsthal_previous = jacobsthal_current
+            jacobsthal_current = jacobsthal_previous + 2 * jacobsthal_backup
+            leeway = jacobsthal_current > len_pairs
+            groups.append(Tuple((jacobsthal_previous, min(jacobsthal_current, len_pairs), leeway)))
+        self.groups = Tuple(groups)
+        self.anchor_positions = FenwickTree(int(slot % 2 or not slot) for slot in range(2 * len_pairs + 1))
+        self.pending = FenwickTree(int(rank > 0) for rank in range(len_pairs))
+
+    def __str__(self):
+        """Return class name followed by number of pairs in parentheses."""
+        return "FordJohnsonPlan(" + str(self.len_pairs) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "FordJohnsonPlan(" + repr(self.len_pairs) + ")"
+
+
+@lru_cache(maxsize=256)
+def ford_johnson_plan(len_pairs):
+    """Return cached FordJohnsonPlan for the number of pairs."""
+    return FordJohnsonPlan(len_pairs)
+
+
+def count_inserted(anchor_positions, inserted_index):
+    """Increment the slot of the gap between anchors the item was inserted into."""
+    # Weights do not count the new item yet, so search finds the item which got shifted up.
+    slot = anchor_positions.search(inserted_index)
+    anchor_positions.add(slot - slot % 2, 1)
+
+
+def efficiency_key(anchor_index):
+    """Return sort key of insertion below anchor_index, least is most efficient.
+
+    Efficiency is ratio of window size to the power of two number of comparisons needed.
+    Negation is used so the most efficient is the least, ties are broken by lower index.
+    """
+    bits = anchor_index.bit_length()
+    return -1.0 * (anchor_index + 1) / (1 << bits), anchor_index
+
+
+def most_efficient_pending(anchor_positions, pending, len_target):
+    """Return efficiency key of the pending anchor at most efficient index, or None if no anchor is pending.
+
+    Within one range of indexes of the same bit length, efficiency increases with index,
+    so only the highest pending anchor of each range is a candidate.
+    Anchor_positions has odd slots for anchors by rank and even slots for items inserted below them,
+    pending has weight 1 for ranks of anchors whose dangler was not inserted yet.
+    """
+    best = None
+    range_start = 2
+    while range_start < len_target:
+        range_stop = min(2 * range_start, len_target)
+        # Greatest rank of anchor positioned below range_stop.
+        rank = (anchor_positions.search(range_stop - 1) - 1) // 2
+        count = pending.prefix_sum(rank + 1)
+        if count:
+            rank = pending.search(count - 1)
+            anchor_index = anchor_positions.prefix_sum(2 * rank + 2) - 1
+            if anchor_index >= range_start:
+                candidate = efficiency_key(anchor_index) + (rank,)
+                if best is None or candidate < best:
+                    best = candidate
+        range_start *= 2
+    return best
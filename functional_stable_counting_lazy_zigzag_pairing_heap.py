@@ -1,8 +1,12 @@
 """Module that defines functional stable zigzag pairing heap."""
 
+from keyed_sorted import keyed_sorted
 from pep_3140 import Deque
 from pep_3140 import List
 from sorted_using_heap import sorted_using_functional_stable_counting_heap
+from sorted_using_heap import iter_sorted_using_functional_stable_counting_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from zigzag_pairing import zigzag_promoted
 from functional_priority_counting_queue import FunctionalPriorityCountingQueue
 
 
@@ -74,6 +78,12 @@ class FunctionalStableCountingLazyZigzagPairingHeap(FunctionalPriorityCountingQu
         copied.length += len(heap)
         return copied
 
+    def _link_with(self, latter, latter_less):
+        """Return copy of the heap including the other one according to comparison."""
+        if latter_less:
+            return latter._include_before(self)
+        return self._include_after(latter)
+
     def peek(self):
         """Return heap with top promoted and top item."""
         if self.is_empty():
@@ -95,36 +105,24 @@ class FunctionalStableCountingLazyZigzagPairingHeap(FunctionalPriorityCountingQu
         """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade and return."""
         if (self.top_item is not None) or (not self.forest):
             return self.copy()
-        popping_forest = Deque([tree.copy() for tree in self.forest])
-        while len(popping_forest) > 1:
-            # zig
-            new_forest = Deque()
-            while len(popping_forest) > 1:
-                latter = popping_forest.pop()
-                former = popping_forest.pop()
-                # Sub-heaps should be nonempty and have top promoted.
-                if latter.top_item < former.top_item:
-                    new_forest.appendleft(latter._include_before(former))
-                else:
-                    new_forest.appendleft(former._include_after(latter))
-            if popping_forest:
-                new_forest.appendleft(popping_forest.pop())
-            popping_forest = new_forest
-            # zag
-            new_forest = Deque()
-            while len(popping_forest) > 1:
-                former = popping_forest.popleft()
-                latter = popping_forest.popleft()
-                if latter.top_item < former.top_item:
-                    new_forest.append(latter._include_before(former))
-                else:
-                    new_forest.append(former._include_after(latter))
-            if popping_forest:
-                new_forest.append(popping_forest.pop())
-            popping_forest = new_forest
-        return popping_forest.pop()
+        if len(self.forest) == 1:
+            # Copy the tree, so the caller can mutate it.
+            return self.forest[0].copy()
+        # Sub-heaps should be nonempty and have top promoted, linking returns new copies.
+        return zigzag_promoted(Deque(self.forest))
 
 
+@keyed_sorted
 def fsclzph_sorted(source):
     """Return new list of items, sorted using the msclzp heap."""
     return sorted_using_functional_stable_counting_heap(FunctionalStableCountingLazyZigzagPairingHeap, source)
+
+
+def fsclzph_iter_sorted(source):
+    """Return generator of items in sorted order, popping them from the fsclzp heap only when requested."""
+    return iter_sorted_using_functional_stable_counting_heap(FunctionalStableCountingLazyZigzagPairingHeap, source)
+
+
+def fsclzph_smallest(k, source):
+    """Return List of k least items in sorted order, popping only k items from the fsclzp heap."""
+    return smallest_using_iter_sorted(fsclzph_iter_sorted, k, source)
@@ -1,8 +1,12 @@
 """Module that defines functional stable zigzag pairing heap."""
 
+from keyed_sorted import keyed_sorted
 from pep_3140 import Deque
-from pep_3140 import List
+from persistent_deque import PersistentDeque
 from sorted_using_heap import sorted_using_functional_stable_heap
+from sorted_using_heap import iter_sorted_using_functional_stable_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from zigzag_pairing import zigzag_promoted
 from functional_priority_queue import FunctionalPriorityQueue
 
 
@@ -12,46 +16,56 @@ class FunctionalStableLazyZigzagPairingHeap(FunctionalPriorityQueue):
     Heap: An implementation, usable as a queue, least priority value in, first out.
     Functional: After creation, state is never changed. Constructing modified object to return if needed.
     Lazy: Least element is determined only upon pop, in hope to get more relevant comparisons.
-    Mutable: Self is altered regularily to avoid excessive object creation.
     Stable: Two include methods to allow caller decide tiebreaker.
     Pairing: Most subheap comparisons are on pairs of "equal" sub-heaps.
     Zigzag: The odd sub-heap is left at alternating ends.
 
-    This implementation uses Deque to store ordered collection of sub-heaps.
-    Note that Deque is mutable."""
+    This implementation uses PersistentDeque to store ordered collection of sub-heaps,
+    so versions of the heap share structure. Add and includes allocate O(1) objects,
+    promotion allocates one heap per link, as linked sub-heaps are never copied."""
 
     def __init__(self, top_item=None, forest=None):
-        """Initialize a queue.."""
+        """Initialize a queue."""
         self.top_item = top_item
-        self.forest = forest if forest is not None else Deque()
-
-    def copy(self):
-        """Return shalow copy for the caller to mutate."""
-        return FunctionalStableLazyZigzagPairingHeap(self.top_item, Deque(self.forest))
+        self.forest = forest if forest is not None else EMPTY_FOREST
 
     def ensure_top_demoted(self):
         """In case heap has a top, demote it so merge is easier."""
         if self.top_item is None:
-            return self.copy()
-        return FunctionalStableLazyZigzagPairingHeap(None, Deque([self]))
+            return self
+        return FunctionalStableLazyZigzagPairingHeap(None, EMPTY_FOREST.append(self))
 
     def add(self, item):
         """Add item to self, prioritized after current items, do not compare yet."""
         ensured = self.ensure_top_demoted()
-        ensured.forest.append(FunctionalStableLazyZigzagPairingHeap(top_item=item))
-        return ensured
+        return FunctionalStableLazyZigzagPairingHeap(None, ensured.forest.append(FunctionalStableLazyZigzagPairingHeap(top_item=item)))
+
+    def merge(self, other):
+        """Return new heap with items of both heaps, items of other prioritized after items of self.
+
+        Neither heap is changed, sub-heaps are shared. No comparison is done yet.
+        """
+        forest = self.ensure_top_demoted().forest
+        if other.top_item is not None:
+            forest = forest.append(other)
+        else:
+            for heap in other.forest:
+                forest = forest.append(heap)
+        return FunctionalStableLazyZigzagPairingHeap(None, forest)
 
     def _include_after(self, heap):
         """Include another heap, prioritized after current items."""
-        copied = self.copy()
-        copied.forest.append(heap)
-        return copied
+        return FunctionalStableLazyZigzagPairingHeap(self.top_item, self.forest.append(heap))
 
     def _include_before(self, heap):
         """Include another heap, prioritized before current items."""
-        copied = self.copy()
-        copied.forest.appendleft(heap)
-        return copied
+        return FunctionalStableLazyZigzagPairingHeap(self.top_item, self.forest.appendleft(heap))
+
+    def _link_with(self, latter, latter_less):
+        """Return new heap including the other one according to comparison."""
+        if latter_less:
+            return latter._include_before(self)
+        return self._include_after(latter)
 
     def peek(self):
         """Return heap with top promoted and top item. Top is None if empty."""
@@ -60,46 +74,33 @@ class FunctionalStableLazyZigzagPairingHeap(FunctionalPriorityQueue):
 
     def pop(self):
         """If not empty, return tuple of the smaller queue and the least item."""
-        ensured = self.ensure_top_promoted()
-        item = ensured.top_item
-        ensured.top_item = None
-        return ensured, item
+        promoted = self.ensure_top_promoted()
+        if promoted.top_item is None:
+            return promoted, None
+        return FunctionalStableLazyZigzagPairingHeap(None, promoted.forest), promoted.top_item
 
     def ensure_top_promoted(self):
-        """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade and return."""
+        """Do pairwise includes in zigzag fashion until there is only one tree. Return that."""
         if (self.top_item is not None) or (not self.forest):
-            return self.copy()
-        # Copy trees so we can mutate them.
-        popping_forest = Deque([tree.copy() for tree in self.forest])
-        while len(popping_forest) > 1:
-            # zig
-            new_forest = Deque()
-            while len(popping_forest) > 1:
-                # Sub-heaps should always be promoted and non-empty.
-                latter = popping_forest.pop()
-                former = popping_forest.pop()
-                if latter.top_item < former.top_item:
-                    new_forest.appendleft(latter._include_before(former))
-                else:
-                    new_forest.appendleft(former._include_after(latter))
-            if popping_forest:
-                new_forest.appendleft(popping_forest.pop())
-            popping_forest = new_forest
-            # zag
-            new_forest = Deque()
-            while len(popping_forest) > 1:
-                former = popping_forest.pop()
-                latter = popping_forest.pop()
-                if latter.top_item < former.top_item:
-                    new_forest.append(latter._include_before(former))
-                else:
-                    new_forest.append(former._include_after(latter))
-            if popping_forest:
-                new_forest.append(popping_forest.pop())
-            popping_forest = new_forest
-        return popping_forest.pop()
+            return self
+        # Working Deque is the only buffer, sub-heaps are never mutated, linking returns new heaps.
+        return zigzag_promoted(Deque(self.forest))
+
 
+EMPTY_FOREST = PersistentDeque()
 
+
+@keyed_sorted
 def fslzph_sorted(source):
     """Return new list of items, sorted using the mslzp heap."""
     return sorted_using_functional_stable_heap(FunctionalStableLazyZigzagPairingHeap, source)
+
+
+def fslzph_iter_sorted(source):
+    """Return generator of items in sorted order, popping them from the fslzp heap only when requested."""
+    return iter_sorted_using_functional_stable_heap(FunctionalStableLazyZigzagPairingHeap, source)
+
+
+def fslzph_smallest(k, source):
+    """Return List of k least items in sorted order, popping only k items from the fslzp heap."""
+    return smallest_using_iter_sorted(fslzph_iter_sorted, k, source)
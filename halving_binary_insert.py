@@ -1,6 +1,7 @@
 """Module that defines binary insert operation using halving pivoting strategy."""
 
-from pluggable_binary_insert import mutating_pluggable_binary_insert
+from pluggable_binary_insert import cached_pivot_offsets
+from pluggable_binary_insert import mutating_scheduled_binary_insert
 
 
 def halving_pivot(lower_index, upper_index):
@@ -13,5 +14,6 @@ def halving_pivot(lower_index, upper_index):
 
 
 def mutating_halving_binary_insert(element, target, lower_index, upper_index):
-    """Binary insertion using halving_pilot plugged to pluggable_binary_insert."""
-    mutating_pluggable_binary_insert(halving_pivot, element, target, lower_index, upper_index)
+    """Binary insertion using cached halving_pivot schedule plugged to scheduled_binary_insert."""
+    pivot_offsets = cached_pivot_offsets(halving_pivot, upper_index - lower_index)
+    return mutating_scheduled_binary_insert(pivot_offsets, element, target, lower_index, upper_index)
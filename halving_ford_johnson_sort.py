@@ -1,11 +1,13 @@
 """Module that defines Ford-Johnson sorting algorithm using halving insertion."""
 
-from halving_binary_insert import mutating_halving_binary_insert
-from pluggable_ford_johnson_sort import pluggable_ford_johnson_sort
+from halving_binary_insert import halving_pivot
+from indexed_ford_johnson_sort import indexed_ford_johnson_sort
+from keyed_sorted import keyed_sorted
 from stabilize_sorted import stabilize_sorted
 
 
+@keyed_sorted
 @stabilize_sorted
 def hfj_sorted(source):
-    """Plug halving_binary_insert into pluggable_ford_johnson_sort."""
-    return pluggable_ford_johnson_sort(mutating_halving_binary_insert, source)
+    """Plug halving_pivot into bottom-up indexed_ford_johnson_sort."""
+    return indexed_ford_johnson_sort(halving_pivot, source)
@@ -0,0 +1,24 @@
+"""Module that defines HeapHandle, a reference to an item stored in a heap.
+
+Heaps supporting decrease_key return handles from add when asked to.
+Handle points to the sub-heap holding the item, the heap updates it when the item moves.
+"""
+
+
+class HeapHandle(object):
+    """Mutable reference to the sub-heap which holds a particular item."""
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        """Point to the sub-heap holding the item."""
+        self.node = node
+
+    @property
+    def item(self):
+        """Return the referenced item, or None if it is no longer in the heap."""
+        return self.node.top_item
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "HeapHandle(" + repr(self.node) + ")"
@@ -0,0 +1,152 @@
+"""Module that defines Ford-Johnson sorting algorithm working on arrays of indexes.
+
+The algorithm and its comparison sequence is the same as in pluggable_ford_johnson_sort,
+but instead of recursing on ComparablePayload pairs (where a comparison on level k
+goes through k nested __lt__ calls), the pairing tree is recorded bottom-up in flat arrays
+and each level is then sorted top-down, comparing the original elements directly.
+Positions are inserted into array for short levels and into BlockedList for long ones,
+as array insert moves all later positions, which is quadratic in data movement.
+"""
+
+from array import array
+from functools import partial
+
+from blocked_list import BlockedList
+from ford_johnson_plan import count_inserted
+from ford_johnson_plan import ford_johnson_plan
+from pep_3140 import List
+from pep_3140 import Tuple
+from pluggable_binary_insert import cached_pivot_offsets
+
+
+# Levels with more keys insert into BlockedList, as array insert moves all later positions.
+BLOCKED_TARGET_THRESHOLD = 1 << 18
+
+position_array = partial(array, 'l')
+
+
+def default_target_class(len_keys):
+    """Return constructor of insertion target for level of given length, array for short levels."""
+    return BlockedList if len_keys > BLOCKED_TARGET_THRESHOLD else position_array
+
+
+def index_binary_insert(pivot_offsets, keys, position, target, lower_index, upper_index):
+    """Insert position into target sequence of positions, comparing keys at those positions.
+
+    Lower index is confirmed to be before, can be -1;
+    Upper index is confirmed to be after, can be len(target).
+    Pivot offsets are read from List indexed by spread, as in mutating_scheduled_binary_insert.
+    In case of tie, position is inserted to upper part.
+    Return index at which the position was inserted.
+    """
+    key = keys[position]
+    while upper_index - lower_index > 1:
+        pivot_index = lower_index + pivot_offsets[upper_index - lower_index]
+        if key < keys[target[pivot_index]]:
+            upper_index = pivot_index
+        else:
+            lower_index = pivot_index
+    target.insert(upper_index, position)
+    return upper_index
+
+
+def pairing_levels(source, oracle=None):
+    """Compare pairs level by level, return List of (keys, winners, losers) Tuples, source level first.
+
+    Keys is List of original elements leading the level items,
+    winners and losers are arrays of positions into keys, indexed by pair.
+    An odd item, if any, is the last one in keys.
+    The level above has keys of winners, the top level (not returned) has a single item.
+
+    If oracle is given, comparisons of a level are passed to it as one batch,
+    see zigzag_pairing for the oracle interface, the oracle is asked whether latter is less than former.
+    """
+    levels = List()
+    keys = source
+    while len(keys) > 1:
+        len_pairs = len(keys) // 2
+        winners = array('l', bytes(len_pairs * array('l').itemsize))
+        losers = array('l', winners)
+        if oracle is not None:
+            former_wins = oracle(List([Tuple((keys[2 * index + 1], keys[2 * index])) for index in range(len_pairs)]))
+        for pair_index in range(len_pairs):
+            former = 2 * pair_index
+            latter = former + 1
+            if former_wins[pair_index] if oracle is not None else keys[former] > keys[latter]:
+                winners[pair_index] = former
+                losers[pair_index] = latter
+            else:
+                winners[pair_index] = latter
+                losers[pair_index] = former
+        levels.append(Tuple((keys, winners, losers)))
+        keys = List([keys[position] for position in winners])
+    return levels
+
+
+def anchors_and_danglers(winners, losers, ranked_pairs):
+    """Return arrays of winner and loser positions, indexed by rank of the pair."""
+    anchors = array('l', [winners[pair_index] for pair_index in ranked_pairs])
+    danglers = array('l', [losers[pair_index] for pair_index in ranked_pairs])
+    return anchors, danglers
+
+
+def jacobsthal_insert_level(pivot_offsets, keys, winners, losers, ranked_pairs, target_class):
+    """Return target_class sequence of positions into keys in sorted order, inserting danglers in Jacobsthal groups.
+
+    Ranked_pairs is sequence of pair indexes, sorted by their winners.
+    """
+    len_keys = len(keys)
+    len_pairs = len(ranked_pairs)
+    anchors, danglers = anchors_and_danglers(winners, losers, ranked_pairs)
+    odd_position = len_keys - 1 if len_keys % 2 else -1
+    target = target_class([danglers[0], anchors[0]])
+    plan = ford_johnson_plan(len_pairs)
+    anchor_positions = plan.anchor_positions.copy()
+    for jacobsthal_previous, jacobsthal_current, leeway in plan.groups:
+        target.extend(anchors[jacobsthal_previous:jacobsthal_current])
+        if leeway:
+            # We have a leeway, we can discount the cost of inserting the odd element.
+            if odd_position >= 0:
+                inserted_index = index_binary_insert(pivot_offsets, keys, odd_position, target, -1, len(target))
+                count_inserted(anchor_positions, inserted_index)
+                odd_position = -1
+        for rank in range(jacobsthal_current - 1, jacobsthal_previous - 1, -1):
+            upper_index = anchor_positions.prefix_sum(2 * rank + 2) - 1
+            inserted_index = index_binary_insert(pivot_offsets, keys, danglers[rank], target, -1, upper_index)
+            count_inserted(anchor_positions, inserted_index)
+    if odd_position >= 0:
+        index_binary_insert(pivot_offsets, keys, odd_position, target, -1, len(target))
+    return target
+
+
+def bottom_up_ford_johnson_sort(insert_level, choose_pivot, original_source, oracle=None, target_class=None):
+    """Record pairing levels, then sort them from the top down using insert_level.
+
+    Insert_level(pivot_offsets, keys, winners, losers, ranked_pairs, target_class) returns sorted positions into keys,
+    pivot_offsets are the cached offsets of choose_pivot.
+    Optional oracle is used for batches of pairing comparisons, see pairing_levels.
+    Target_class constructs insertion targets from iterable of positions,
+    by default it is chosen per level by default_target_class, so data movement stays below quadratic.
+
+    Original_source should be iterable supporting len() and element should support comparison.
+    Returned value is either the original, or a new List.
+    This sort is functional, in sense it does not modify original source.
+    """
+    if len(original_source) < 2:
+        return original_source
+    source = List(original_source)
+    pivot_offsets = cached_pivot_offsets(choose_pivot, len(source) + 1)
+    ranked_positions = array('l', [0])
+    for keys, winners, losers in reversed(pairing_levels(source, oracle)):
+        level_target_class = default_target_class(len(keys)) if target_class is None else target_class
+        ranked_positions = insert_level(pivot_offsets, keys, winners, losers, ranked_positions, level_target_class)
+    return List([source[position] for position in ranked_positions])
+
+
+def indexed_ford_johnson_sort(choose_pivot, original_source, oracle=None, target_class=None):
+    """Sort using bottom_up_ford_johnson_sort with Jacobsthal insertion order.
+
+    Comparisons are done in the same order as in pluggable_ford_johnson_sort
+    with mutating_pluggable_binary_insert using the same choose_pivot.
+    """
+    return bottom_up_ford_johnson_sort(jacobsthal_insert_level, choose_pivot, original_source, oracle, target_class)
@@ -0,0 +1,46 @@
+"""Module that defines reordered Ford-Johnson sorting algorithm working on sequences of indexes."""
+
+from ford_johnson_plan import count_inserted
+from ford_johnson_plan import efficiency_key
+from ford_johnson_plan import ford_johnson_plan
+from ford_johnson_plan import most_efficient_pending
+from indexed_ford_johnson_sort import anchors_and_danglers
+from indexed_ford_johnson_sort import bottom_up_ford_johnson_sort
+from indexed_ford_johnson_sort import index_binary_insert
+
+
+def reordered_insert_level(pivot_offsets, keys, winners, losers, ranked_pairs, target_class):
+    """Return target_class sequence of positions into keys in sorted order, inserting the most efficient dangler first.
+
+    Ranked_pairs is sequence of pair indexes, sorted by their winners.
+    The order is the same as in pluggable_reordered_ford_johnson_sort.
+    """
+    len_keys = len(keys)
+    anchors, danglers = anchors_and_danglers(winners, losers, ranked_pairs)
+    odd_position = len_keys - 1 if len_keys % 2 else -1
+    target = target_class(danglers[:1])
+    target.extend(anchors)
+    plan = ford_johnson_plan(len(ranked_pairs))
+    anchor_positions = plan.anchor_positions.copy()
+    pending = plan.pending.copy()
+    for _ in range(len_keys - len(target)):
+        len_target = len(target)
+        best = most_efficient_pending(anchor_positions, pending, len_target)
+        if odd_position >= 0 and (best is None or efficiency_key(len_target) < best):
+            inserted_index = index_binary_insert(pivot_offsets, keys, odd_position, target, -1, len_target)
+            odd_position = -1
+        else:
+            _, anchor_index, rank = best
+            pending.add(rank, -1)
+            inserted_index = index_binary_insert(pivot_offsets, keys, danglers[rank], target, -1, anchor_index)
+        count_inserted(anchor_positions, inserted_index)
+    return target
+
+
+def indexed_reordered_ford_johnson_sort(choose_pivot, original_source, oracle=None, target_class=None):
+    """Sort using bottom_up_ford_johnson_sort with reordered insertion order.
+
+    Comparisons are done in the same order as in pluggable_reordered_ford_johnson_sort
+    with mutating_pluggable_binary_insert using the same choose_pivot.
+    """
+    return bottom_up_ford_johnson_sort(reordered_insert_level, choose_pivot, original_source, oracle, target_class)
@@ -0,0 +1,36 @@
+"""Module that defines keyed_sorted decorator, adding key and reverse arguments to sorted() candidates.
+
+Keys are computed once per item (Decorate+Sort+Undecorate with ComparablePayload),
+so an expensive key function is called n times, not once per comparison.
+Reverse is done as in sorted(): source is reversed, sorted and the result reversed again,
+so a stable sort stays stable.
+"""
+
+from comparable_payload import ComparablePayload
+from pep_3140 import List
+
+
+def keyed_sorted(plain_sorted):
+    """Return function with sorted()-compatible key and reverse arguments, calling the argument function.
+
+    Other keyword arguments are passed to the argument function.
+    """
+
+    def sorted_with_key(source_iterable, key=None, reverse=False, **options):
+        """Compute keys once, decorate, call plain_sorted, undecorate and return the resulting List."""
+        if key is None and not reverse:
+            return plain_sorted(source_iterable, **options)
+        source = List(source_iterable)
+        if reverse:
+            source.reverse()
+        if key is None:
+            result = List(plain_sorted(source, **options))
+        else:
+            keys = List(map(key, source))
+            decorated_list = List([ComparablePayload(item_key, item) for item_key, item in zip(keys, source)])
+            result = List([item.payload for item in plain_sorted(decorated_list, **options)])
+        if reverse:
+            result.reverse()
+        return result
+
+    return sorted_with_key
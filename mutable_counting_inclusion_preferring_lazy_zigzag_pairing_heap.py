@@ -1,8 +1,14 @@
 """Module that defines mutable inclusion preferring zigzag pairing heap."""
 
+from functools import partial
+
+from keyed_sorted import keyed_sorted
 from pep_3140 import Deque
 from pep_3140 import List
 from sorted_using_heap import sorted_using_mutable_unstable_counting_heap
+from sorted_using_heap import iter_sorted_using_mutable_unstable_counting_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from zigzag_pairing import zigzag_promoted
 from mutable_counting_priority_queue import MutableCountingPriorityQueue
 
 
@@ -18,10 +24,12 @@ class MutableCountingInclusionPreferringLazyZigzagPairingHeap(MutableCountingPri
     Zigzag: The odd sub-heap is left at alternating ends.
     This heap does NOT result in stable sort algorithm.
 
-    This implementation uses Deque to store ordered collection of sub-heaps."""
+    This implementation uses Deque to store ordered collection of sub-heaps.
+    Comparisons of a zig or zag pass can be batched, see zigzag_pairing."""
 
-    def __init__(self, top_item=None, forest=None, known_length=None):
-        """Initialize a queue."""
+    def __init__(self, top_item=None, forest=None, known_length=None, oracle=None):
+        """Initialize a queue, oracle is used for batches of comparisons when promoting top."""
+        self.oracle = oracle
         self.top_item = top_item
         self.forest = forest if forest is not None else Deque()
         if known_length is not None:
@@ -63,6 +71,14 @@ class MutableCountingInclusionPreferringLazyZigzagPairingHeap(MutableCountingPri
         self.length += len(heap)
         self.forest.appendleft(heap)
 
+    def _link_with(self, latter, latter_less):
+        """Include latter heap or be included into it according to comparison, return the including heap."""
+        if latter_less:
+            latter._include_before(self)
+            return latter
+        self._include_before(latter)
+        return self
+
     def peek(self):
         """Return least priority item, this includes promoting top, but not extraction."""
         if self.is_empty():
@@ -84,41 +100,22 @@ class MutableCountingInclusionPreferringLazyZigzagPairingHeap(MutableCountingPri
         """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade."""
         if (self.top_item is not None) or (not self.forest):
             return
-        while len(self.forest) > 1:
-            # zig
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                latter = self.forest.pop()
-                former = self.forest.pop()
-                # Sub-heaps should be nonempty and have top promoted.
-                if latter.top_item < former.top_item:
-                    latter._include_before(former)
-                    new_forest.appendleft(latter)
-                else:
-                    former._include_before(latter)
-                    new_forest.appendleft(former)
-            if self.forest:
-                new_forest.appendleft(self.forest.pop())
-            self.forest = new_forest
-            # zag
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                former = self.forest.popleft()
-                latter = self.forest.popleft()
-                if latter.top_item < former.top_item:
-                    latter._include_before(former)
-                    new_forest.append(latter)
-                else:
-                    former._include_before(latter)
-                    new_forest.append(former)
-            if self.forest:
-                new_forest.append(self.forest.pop())
-            self.forest = new_forest
-        new_state = self.forest.pop()
+        new_state = zigzag_promoted(self.forest, self.oracle)
         self.top_item = new_state.top_item
         self.forest = new_state.forest
 
 
-def mciplzph_sorted(source):
+@keyed_sorted
+def mciplzph_sorted(source, unique=False):
     """Return new list of items, sorted using the mciplzp heap."""
-    return sorted_using_mutable_unstable_counting_heap(MutableCountingInclusionPreferringLazyZigzagPairingHeap, source)
+    return sorted_using_mutable_unstable_counting_heap(MutableCountingInclusionPreferringLazyZigzagPairingHeap, source, unique)
+
+
+def mciplzph_iter_sorted(source, unique=False):
+    """Return generator of items in sorted order, popping them from the mciplzp heap only when requested."""
+    return iter_sorted_using_mutable_unstable_counting_heap(MutableCountingInclusionPreferringLazyZigzagPairingHeap, source, unique)
+
+
+def mciplzph_smallest(k, source, unique=False):
+    """Return List of k least items in sorted order, popping only k items from the mciplzp heap."""
+    return smallest_using_iter_sorted(partial(mciplzph_iter_sorted, unique=unique), k, source)
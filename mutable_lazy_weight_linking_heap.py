@@ -1,8 +1,17 @@
 """Module that defines mutable weight linking lazy heap."""
 
+from functools import partial
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from keyed_sorted import keyed_sorted
 from pep_3140 import List
+from pep_3140 import Tuple
 from comparable_payload import ComparablePayload
 from sorted_using_heap import sorted_using_mutable_unstable_counting_heap
+from sorted_using_heap import iter_sorted_using_mutable_unstable_counting_heap
+from sorted_using_heap import smallest_using_iter_sorted
 from mutable_counting_priority_queue import MutableCountingPriorityQueue
 
 
@@ -16,7 +25,8 @@ class MutableLazyWeightLinkingHeap(MutableCountingPriorityQueue):
     Weight: The two heaps to link are the ones with least elements in them.
     This heap does NOT result in stable sort algorithm.
 
-    This implementation uses List and sort() to store collection of sub-heaps.
+    This implementation uses List to store collection of sub-heaps,
+    when promoting top, sub-heaps are linked using heapq prioritized by weight.
 
     Sub-heaps are prioritized by their length, so item of forest is ComparablePayload(length, sub-heap)
     Items are checked by "is None", as empty string and zero are valid items with false truth value."""
@@ -63,7 +73,7 @@ class MutableLazyWeightLinkingHeap(MutableCountingPriorityQueue):
 
     def _include(self, heap):
         """Include another heap, no comparisons other than to top, which is assumed to be done already."""
-        weight = len(heap)
+        weight = heap.weight
         self.forest.append(ComparablePayload(weight, heap))
         self.weight += weight
 
@@ -85,27 +95,43 @@ class MutableLazyWeightLinkingHeap(MutableCountingPriorityQueue):
         return item
 
     def ensure_top_promoted(self):
-        """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade."""
+        """Link the two lightest sub-heaps until there is only one tree. Then upgrade."""
         if (self.top_item is not None) or (not self.forest):
             return
-        while len(self.forest) > 1:
-            self.forest.sort()
-            smaller = self.forest[0].payload
-            bigger = self.forest[1].payload
+        # Lightest sub-heaps are linked first, ties are broken by forest order, as in a stable sort.
+        # Linked sub-heap gets the next sequence number, so it is ordered after equal weights.
+        # Sequence numbers are unique, so heapq never compares the sub-heaps themselves.
+        queue = List([Tuple((element.key, sequence, element.payload)) for sequence, element in enumerate(self.forest)])
+        heapify(queue)
+        sequence = len(queue)
+        while len(queue) > 1:
+            smaller = heappop(queue)[2]
+            bigger = heappop(queue)[2]
             # Sub-heaps should be nonempty and have top promoted.
             if smaller.top_item <= bigger.top_item:
                 smaller._include(bigger)
-                self.forest[:2] = []
-                self.forest.append(ComparablePayload(len(smaller), smaller))
+                linked = smaller
             else:
                 bigger._include(smaller)
-                self.forest[:2] = []
-                self.forest.append(ComparablePayload(len(bigger), bigger))
-        new_state = self.forest[0].payload
+                linked = bigger
+            heappush(queue, Tuple((linked.weight, sequence, linked)))
+            sequence += 1
+        new_state = queue[0][2]
         self.top_item = new_state.top_item
         self.forest = new_state.forest
 
 
-def mlwlh_sorted(source):
+@keyed_sorted
+def mlwlh_sorted(source, unique=False):
     """Return new list of itemss, sorted using the mslzp heap."""
-    return sorted_using_mutable_unstable_counting_heap(MutableLazyWeightLinkingHeap, source)
+    return sorted_using_mutable_unstable_counting_heap(MutableLazyWeightLinkingHeap, source, unique)
+
+
+def mlwlh_iter_sorted(source, unique=False):
+    """Return generator of items in sorted order, popping them from the mlwl heap only when requested."""
+    return iter_sorted_using_mutable_unstable_counting_heap(MutableLazyWeightLinkingHeap, source, unique)
+
+
+def mlwlh_smallest(k, source, unique=False):
+    """Return List of k least items in sorted order, popping only k items from the mlwl heap."""
+    return smallest_using_iter_sorted(partial(mlwlh_iter_sorted, unique=unique), k, source)
@@ -0,0 +1,154 @@
+"""Module that defines mutable stable zigzag pairing heap with nodes stored in an arena."""
+
+from array import array
+
+from keyed_sorted import keyed_sorted
+from pep_3140 import List
+from sorted_using_heap import sorted_using_mutable_stable_heap
+from sorted_using_heap import iter_sorted_using_mutable_stable_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from mutable_priority_queue import MutablePriorityQueue
+
+NO_NODE = -1
+
+
+class MutableStableArenaLazyZigzagPairingHeap(MutablePriorityQueue):
+    """A heap that is mutable, stable, lazy, and zigzag pairing, allocating no object per item.
+
+    Heap: An implementation, usable as a queue, least priority value in, first out.
+    Lazy: Least element is determined only upon pop, in hope to get more relevant comparisons.
+    Mutable: Self is altered regularily to avoid excessive object creation.
+    Stable: Ties are linked to keep the item added earlier on top.
+    Pairing: Most subheap comparisons are on pairs of "equal" sub-heaps.
+    Zigzag: The odd sub-heap is left at alternating ends.
+    Arena: Sub-heaps are integer node indices into parallel arrays
+    of items, first children, last children and next siblings.
+    Nodes of popped items are reused via a free list.
+
+    Sub-heaps are linked in the same order as in MutableStableLazyZigzagPairingHeap,
+    so the comparisons done are the same.
+    The forest of root nodes is kept as a List of indices.
+    When the top is promoted, the forest has a single node, holding the top item."""
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self.items = List()
+        self.first_child = array('l')
+        self.last_child = array('l')
+        self.next_sibling = array('l')
+        self.free_nodes = array('l')
+        self.forest = List()
+        self.promoted = False
+
+    def _new_node(self, item):
+        """Return index of a node holding item, with no children, reusing a free node if possible."""
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            self.items[node] = item
+            self.first_child[node] = NO_NODE
+            self.last_child[node] = NO_NODE
+            self.next_sibling[node] = NO_NODE
+            return node
+        self.items.append(item)
+        self.first_child.append(NO_NODE)
+        self.last_child.append(NO_NODE)
+        self.next_sibling.append(NO_NODE)
+        return len(self.items) - 1
+
+    def _link(self, former, latter):
+        """Include one of the sub-heaps into the other according to comparison, return the including one.
+
+        Former is included before children of latter if latter is less (as in _include_before),
+        otherwise latter is included after children of former (as in _include_after).
+        """
+        next_sibling = self.next_sibling
+        if self.items[latter] < self.items[former]:
+            first = self.first_child[latter]
+            if first == NO_NODE:
+                self.last_child[latter] = former
+            next_sibling[former] = first
+            self.first_child[latter] = former
+            return latter
+        last = self.last_child[former]
+        if last == NO_NODE:
+            self.first_child[former] = latter
+        else:
+            next_sibling[last] = latter
+        self.last_child[former] = latter
+        # Former roots may still point to their former siblings.
+        next_sibling[latter] = NO_NODE
+        return former
+
+    def add(self, item):
+        """Add item to self, prioritized after current items, do not compare yet."""
+        # Demoting the top is free, the single node stays in forest.
+        self.promoted = False
+        self.forest.append(self._new_node(item))
+
+    def peek(self):
+        """Return least priority item, this includes promoting top, but not extraction."""
+        self.ensure_top_promoted()
+        return self.items[self.forest[0]] if self.promoted else None
+
+    def pop(self):
+        """If not empty, extract the least item from self and return that."""
+        self.ensure_top_promoted()
+        if not self.promoted:
+            return None
+        node = self.forest[0]
+        item = self.items[node]
+        forest = self.forest
+        forest.clear()
+        child = self.first_child[node]
+        while child != NO_NODE:
+            forest.append(child)
+            child = self.next_sibling[child]
+        self.items[node] = None
+        self.free_nodes.append(node)
+        self.promoted = False
+        return item
+
+    def ensure_top_promoted(self):
+        """Do pairwise includes in zigzag fashion until there is only one tree, in place in forest."""
+        if self.promoted or not self.forest:
+            return
+        forest = self.forest
+        link = self._link
+        while len(forest) > 1:
+            # zig, writing linked sub-heaps from the end
+            len_forest = len(forest)
+            write = len_forest
+            for start in range(len_forest - 2, len_forest % 2 - 1, -2):
+                write -= 1
+                forest[write] = link(forest[start], forest[start + 1])
+            if len_forest % 2:
+                write -= 1
+                forest[write] = forest[0]
+            del forest[:write]
+            # zag, writing linked sub-heaps from the start
+            len_forest = len(forest)
+            write = 0
+            for start in range(0, len_forest - 1, 2):
+                forest[write] = link(forest[start], forest[start + 1])
+                write += 1
+            if len_forest % 2:
+                forest[write] = forest[-1]
+                write += 1
+            del forest[write:]
+        self.promoted = True
+
+
+@keyed_sorted
+def msalzph_sorted(source):
+    """Return new List of items, sorted using the msalzp heap."""
+    return sorted_using_mutable_stable_heap(MutableStableArenaLazyZigzagPairingHeap, source)
+
+
+def msalzph_iter_sorted(source):
+    """Return generator of items in sorted order, popping them from the msalzp heap only when requested."""
+    return iter_sorted_using_mutable_stable_heap(MutableStableArenaLazyZigzagPairingHeap, source)
+
+
+def msalzph_smallest(k, source):
+    """Return List of k least items in sorted order, popping only k items from the msalzp heap."""
+    return smallest_using_iter_sorted(msalzph_iter_sorted, k, source)
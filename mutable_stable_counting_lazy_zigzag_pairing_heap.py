@@ -1,12 +1,17 @@
 """Module that defines mutable stable zigzag pairing heap."""
 
+from keyed_sorted import keyed_sorted
 from pep_3140 import Deque
 from pep_3140 import List
 from sorted_using_heap import sorted_using_mutable_stable_counting_heap
+from sorted_using_heap import iter_sorted_using_mutable_stable_counting_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from zigzag_pairing import HandledZigzagHeapMixin
+from zigzag_pairing import singleton_forest
 from mutable_counting_priority_queue import MutableCountingPriorityQueue
 
 
-class MutableStableCountingLazyZigzagPairingHeap(MutableCountingPriorityQueue):
+class MutableStableCountingLazyZigzagPairingHeap(HandledZigzagHeapMixin, MutableCountingPriorityQueue):
     """A heap that is mutable, stable, lazy, and zigzag pairing.
 
     Heap: An implementation, usable as a queue, least priority value in, first out.
@@ -17,12 +22,18 @@ class MutableStableCountingLazyZigzagPairingHeap(MutableCountingPriorityQueue):
     Pairing: Most subheap comparisons are on pairs of "equal" sub-heaps.
     Zigzag: The odd sub-heap is left at alternating ends.
 
-    This implementation uses Deque to store ordered collection of sub-heaps."""
+    This implementation uses Deque to store ordered collection of sub-heaps.
+    Comparisons of a zig or zag pass can be batched, see zigzag_pairing.
 
-    def __init__(self, top_item=None, forest=None, known_length=None):
-        """Initialize a queue."""
+    Add can return a HeapHandle for decrease_key, see HandledZigzagHeapMixin."""
+
+    def __init__(self, top_item=None, forest=None, known_length=None, oracle=None):
+        """Initialize a queue, oracle is used for batches of comparisons when promoting top."""
+        self.oracle = oracle
         self.top_item = top_item
         self.forest = forest if forest is not None else Deque()
+        self.top_node = None
+        self.vacated = 0
         if known_length is not None:
             self.length = known_length
         else:
@@ -41,20 +52,36 @@ class MutableStableCountingLazyZigzagPairingHeap(MutableCountingPriorityQueue):
         """Return boolean corresponding to opposite of emptiness of the queue."""
         return self.length > 0
 
+    @classmethod
+    def from_iterable(cls, iterable, oracle=None):
+        """Return new heap with items of iterable, prioritized in iteration order, do not compare yet.
+
+        Equivalent to adding the items one by one to an empty heap, without demotions.
+        """
+        forest = singleton_forest(cls._singleton, iterable)
+        return cls(forest=forest, known_length=len(forest), oracle=oracle)
+
+    @classmethod
+    def _singleton(cls, item):
+        """Return new heap holding only the item."""
+        return cls(top_item=item, known_length=1)
+
     def ensure_top_demoted(self):
         """In case heap has a top, demote it so merge is easier."""
         if self.top_item is None:
             return
-        demoted = MutableStableCountingLazyZigzagPairingHeap(self.top_item, self.forest, self.length)
+        demoted = self.top_node
+        if demoted is None:
+            demoted = MutableStableCountingLazyZigzagPairingHeap(self.top_item, self.forest, self.length)
+        else:
+            # Reuse the sub-heap the top came from, so its handle stays valid.
+            demoted.top_item = self.top_item
+            demoted.forest = self.forest
+            demoted.length = self.length
+            self.top_node = None
         self.top_item = None
         self.forest = Deque([demoted])
 
-    def add(self, item):
-        """Add item to self, prioritized after current items, do not compare yet."""
-        self.ensure_top_demoted()
-        self.forest.append(MutableStableCountingLazyZigzagPairingHeap(top_item=item))
-        self.length += 1
-
     def _include_after(self, heap):
         """Include another heap, prioritized after current items."""
         self.length += len(heap)
@@ -65,6 +92,14 @@ class MutableStableCountingLazyZigzagPairingHeap(MutableCountingPriorityQueue):
         self.length += len(heap)
         self.forest.appendleft(heap)
 
+    def _link_with(self, latter, latter_less):
+        """Include latter heap or be included into it according to comparison, return the including heap."""
+        if latter_less:
+            latter._include_before(self)
+            return latter
+        self._include_after(latter)
+        return self
+
     def peek(self):
         """Return least priority item, this includes promoting top, but not extraction."""
         if self.is_empty():
@@ -79,49 +114,26 @@ class MutableStableCountingLazyZigzagPairingHeap(MutableCountingPriorityQueue):
         self.ensure_top_promoted()
         item = self.top_item
         self.top_item = None
+        self._release_top_node()
         self.length -= 1
+        if not self.length:
+            # Only vacated sub-heaps can remain, pop would not reach them.
+            self.forest = Deque()
+            self.vacated = 0
         return item
 
-    # TODO: Merge this into peek(), weak heaps suggest that makes things faster. Or is it not bothering with len?
-    def ensure_top_promoted(self):
-        """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade."""
-        if (self.top_item is not None) or (not self.forest):
-            return
-        while len(self.forest) > 1:
-            # zig
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                latter = self.forest.pop()
-                former = self.forest.pop()
-                # Sub-heaps should be nonempty and have top promoted.
-                if latter.top_item < former.top_item:
-                    latter._include_before(former)
-                    new_forest.appendleft(latter)
-                else:
-                    former._include_after(latter)
-                    new_forest.appendleft(former)
-            if self.forest:
-                new_forest.appendleft(self.forest.pop())
-            self.forest = new_forest
-            # zag
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                former = self.forest.popleft()
-                latter = self.forest.popleft()
-                if latter.top_item < former.top_item:
-                    latter._include_before(former)
-                    new_forest.append(latter)
-                else:
-                    former._include_after(latter)
-                    new_forest.append(former)
-            if self.forest:
-                new_forest.append(self.forest.pop())
-            self.forest = new_forest
-        new_state = self.forest.pop()
-        self.top_item = new_state.top_item
-        self.forest = new_state.forest
-
 
+@keyed_sorted
 def msclzph_sorted(source):
     """Return new List of items, sorted using the msclzp heap."""
     return sorted_using_mutable_stable_counting_heap(MutableStableCountingLazyZigzagPairingHeap, source)
+
+
+def msclzph_iter_sorted(source):
+    """Return generator of items in sorted order, popping them from the msclzp heap only when requested."""
+    return iter_sorted_using_mutable_stable_counting_heap(MutableStableCountingLazyZigzagPairingHeap, source)
+
+
+def msclzph_smallest(k, source):
+    """Return List of k least items in sorted order, popping only k items from the msclzp heap."""
+    return smallest_using_iter_sorted(msclzph_iter_sorted, k, source)
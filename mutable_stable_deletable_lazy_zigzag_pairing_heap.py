@@ -1,11 +1,25 @@
 """Module that defines mutable stable deletable zigzag pairing heap."""
 
+from collections import Counter
+
+from keyed_sorted import keyed_sorted
 from pep_3140 import Deque
 from pep_3140 import List
 from sorted_using_heap import sorted_using_mutable_stable_heap
+from sorted_using_heap import iter_sorted_using_mutable_stable_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from zigzag_pairing import zigzag_promoted
 from mutable_deletable_priority_queue import MutableDeletablePriorityQueue
 
 
+def _discard_one(counter, item):
+    """Decrement count of item, removing it from counter when it reaches zero."""
+    if counter[item] > 1:
+        counter[item] -= 1
+    else:
+        del counter[item]
+
+
 class MutableStableDeletableLazyZigzagPairingHeap(MutableDeletablePriorityQueue):
     """A heap that is mutable, stable, lazy, and zigzag pairing.
 
@@ -18,18 +32,80 @@ class MutableStableDeletableLazyZigzagPairingHeap(MutableDeletablePriorityQueue)
     Zigzag: The odd sub-heap is left at alternating ends.
 
     This implementation uses Deque to store ordered collection of sub-heaps.
-    Limitation: Items have to be hashable, as deletion is lazy, using set.
+    Limitation: Items have to be hashable, as deletion is lazy, using Counter.
+    Items are not hashed while there are no pending deletions, so sorting works with unhashable items.
+    Deleting an item removes one of its occurrences, stored now or added later.
+
+    Deleted items stay in sub-heaps as tombstones until they reach the top,
+    unless there are more tombstones than compaction_fraction of stored items,
+    then all sub-heaps are purged at once, keeping their forest order.
+    Deletions left unmatched by a purge cancel the next adds of equal items instead.
+    The heap used as a queue counts stored items and tombstones, sub-heaps keep the class defaults.
     """
 
-    def __init__(self, top_item=None, forest=None, deleted=None):
-        """Initialize a queue."""
+    compaction_fraction = 0.5
+    stored = 0
+    tombstones = 0
+    unmatched = None
+
+    def __init__(self, top_item=None, forest=None, deleted=None, compaction_fraction=None, oracle=None):
+        """Initialize a queue, oracle is used for batches of comparisons when promoting top."""
+        self.oracle = oracle
         self.top_item = top_item
         self.forest = Deque() if forest is None else forest
-        self.deleted = set() if deleted is None else deleted
+        self.deleted = Counter() if deleted is None else deleted
+        if compaction_fraction is not None:
+            self.compaction_fraction = compaction_fraction
 
     def delete(self, item):
-        """Lazily remove the item from consideration. TODO: Check whether is even in?"""
-        self.delete.add(item)
+        """Lazily remove one occurrence of the item, purge tombstones if there are too many."""
+        self.deleted[item] += 1
+        # Until a purge, deletion is assumed to match a stored item.
+        self.tombstones += 1
+        if self.tombstones > self.compaction_fraction * self.stored:
+            self.purge_deleted()
+
+    def purge_deleted(self):
+        """Remove deleted items from all sub-heaps, replacing each by its sub-heaps in forest order."""
+        deleted = self.deleted
+        if not deleted:
+            return
+        dropped = 0
+        if self.top_item is not None and self.top_item in deleted:
+            _discard_one(deleted, self.top_item)
+            self.top_item = None
+            dropped += 1
+        # Explicit stack of heaps to purge, as sub-heaps can be nested deeply.
+        pending = List([self])
+        while pending:
+            heap = pending.pop()
+            dropped += heap._splice_deleted()
+            pending.extend(heap.forest)
+        self.stored -= dropped
+        # All remaining deletions matched nothing stored.
+        self.unmatched = Counter(deleted)
+        self.tombstones = 0
+
+    def _splice_deleted(self):
+        """Replace sub-heaps of forest having deleted tops by their sub-heaps, keeping forest order.
+
+        Return number of deleted items dropped.
+        """
+        deleted = self.deleted
+        dropped = 0
+        old_forest = self.forest
+        new_forest = Deque()
+        while old_forest:
+            tree = old_forest.popleft()
+            if deleted and tree.top_item in deleted:
+                _discard_one(deleted, tree.top_item)
+                dropped += 1
+                # Included sub-heaps are not less than the deleted top, so they can take its place.
+                old_forest.extendleft(reversed(tree.forest))
+                continue
+            new_forest.append(tree)
+        self.forest = new_forest
+        return dropped
 
     def ensure_top_demoted(self):
         """In case heap has a top, demote it so merge is easier."""
@@ -41,11 +117,13 @@ class MutableStableDeletableLazyZigzagPairingHeap(MutableDeletablePriorityQueue)
 
     def add(self, item):
         """Add item to self, prioritized after current items, do not compare yet."""
-        if item in self.deleted:
-            self.deleted.remove(item)
+        if self.unmatched and item in self.unmatched:
+            _discard_one(self.unmatched, item)
+            _discard_one(self.deleted, item)
             return
         self.ensure_top_demoted()
         self.forest.append(MutableStableDeletableLazyZigzagPairingHeap(item, None, self.deleted))
+        self.stored += 1
 
     def _include_after(self, heap):
         """Include another heap, prioritized after current items."""
@@ -55,71 +133,69 @@ class MutableStableDeletableLazyZigzagPairingHeap(MutableDeletablePriorityQueue)
         """Include another heap, prioritized before current items."""
         self.forest.appendleft(heap)
 
+    def _link_with(self, latter, latter_less):
+        """Include latter heap or be included into it according to comparison, return the including heap."""
+        if latter_less:
+            latter._include_before(self)
+            return latter
+        self._include_after(latter)
+        return self
+
+    def _counted_top_promoted(self):
+        """Ensure top promoted, do not count tombstones dropped on the way as stored."""
+        dropped = self.ensure_top_promoted()
+        self.stored -= dropped
+        self.tombstones -= dropped
+
     def peek(self):
         """Return least priority item, this includes promoting top, but not extraction."""
-        self.ensure_top_promoted()
+        self._counted_top_promoted()
         return self.top_item
 
     def pop(self):
         """If not empty, extract the least item from self and return that."""
-        self.ensure_top_promoted()
+        self._counted_top_promoted()
         item = self.top_item
-        self.top_item = None
+        if item is not None:
+            self.top_item = None
+            self.stored -= 1
         return item
 
     # TODO: Merge this into peek(), weak heaps suggest that makes things faster. Or is it not bothering with len?
     def ensure_top_promoted(self):
-        """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade."""
+        """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade.
+
+        Return number of deleted items dropped on the way.
+        """
+        dropped = 0
         if (self.top_item is not None):
-            if self.top_item not in self.deleted:
-                return
+            if not self.deleted or self.top_item not in self.deleted:
+                return dropped
+            _discard_one(self.deleted, self.top_item)
             self.top_item = None
-            self.deleted.remove(self.item)
+            dropped += 1
+        if self.deleted:
+            # Deleted tops only matter in the top level forest, deeper ones are spliced when they get there.
+            dropped += self._splice_deleted()
         if not self.forest:
-            return
-        # Make sure subheaps do not have deleted tops before zigzagging.
-        new_forest = Deque()
-        while len(self.forest):
-            tree = self.forest.pop()
-            tree.ensure_top_promoted()
-            if tree.top_item is not None:
-                new_forest.appendleft(tree)
-        self.forest = new_forest
-        while len(self.forest) > 1:
-            # zig
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                latter = self.forest.pop()
-                former = self.forest.pop()
-                # Sub-heaps should be nonempty and have top promoted (and not deleted).
-                if latter.top_item < former.top_item:
-                    latter._include_before(former)
-                    new_forest.appendleft(latter)
-                else:
-                    former._include_after(latter)
-                    new_forest.appendleft(former)
-            if self.forest:
-                new_forest.appendleft(self.forest.pop())
-            self.forest = new_forest
-            # zag
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                former = self.forest.popleft()
-                latter = self.forest.popleft()
-                if latter.top_item < former.top_item:
-                    latter._include_before(former)
-                    new_forest.append(latter)
-                else:
-                    former._include_after(latter)
-                    new_forest.append(former)
-            if self.forest:
-                new_forest.append(self.forest.pop())
-            self.forest = new_forest
-        new_state = self.forest.pop()
+            return dropped
+        new_state = zigzag_promoted(self.forest, self.oracle)
         self.top_item = new_state.top_item
         self.forest = new_state.forest
+        return dropped
 
 
+@keyed_sorted
 def msdlzph_sorted(source):
     """Return new List of items, sorted using the msdlzp heap."""
     return sorted_using_mutable_stable_heap(MutableStableDeletableLazyZigzagPairingHeap, source)
+
+
+def msdlzph_iter_sorted(source):
+    """Return generator of items in sorted order, popping them from the msdlzp heap only when requested."""
+    return iter_sorted_using_mutable_stable_heap(MutableStableDeletableLazyZigzagPairingHeap, source)
+
+
+def msdlzph_smallest(k, source):
+    """Return List of k least items in sorted order, popping only k items from the msdlzp heap."""
+    return smallest_using_iter_sorted(msdlzph_iter_sorted, k, source)
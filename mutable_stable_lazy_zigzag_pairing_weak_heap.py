@@ -2,22 +2,97 @@
 
 from weakref import ref
 
+from keyed_sorted import keyed_sorted
 from pep_3140 import Deque
 from pep_3140 import List
 from sorted_using_weak_heap import sorted_using_mutable_stable_weak_heap
+from sorted_using_weak_heap import iter_sorted_using_mutable_stable_weak_heap
+from sorted_using_heap import smallest_using_iter_sorted
+from zigzag_pairing import zigzag_promoted
 from mutable_priority_weak_queue import MutablePriorityWeakQueue
 
 
-def _ref_or_none(item):
-    """Return weak reference if item is (or points to) non-None, else return None."""
-    if isinstance(item, ref):
-        item = item()
-    return None if item is None else ref(item)
+class _TombstoneCounter(object):
+    """Weakref callback counting stored items which died, so the heap knows how many dead sub-heaps it holds."""
 
+    __slots__ = ("count",)
 
-def _item_or_none(reference):
-    """Return weakly referenced item, or None if reference is None or the item is dead."""
-    return None if reference is None else reference()
+    def __init__(self):
+        """Start with no dead items."""
+        self.count = 0
+
+    def __call__(self, reference):
+        """Count one more dead item."""
+        self.count += 1
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "_TombstoneCounter()"
+
+
+class _WeakSubHeap(object):
+    """Sub-heap of weak heap, holding weak reference to its top item and forest of included sub-heaps.
+
+    Forest is None until something is included, as most sub-heaps stay leaves."""
+
+    __slots__ = ("top_ref", "forest")
+
+    def __init__(self, top_ref, forest=None):
+        """Initialize from weak reference to top item and optional Deque of sub-heaps."""
+        self.top_ref = top_ref
+        self.forest = forest
+
+    @property
+    def top_item(self):
+        """Return the top item, or None if it is dead."""
+        return self.top_ref()
+
+    def _include_after(self, heap):
+        """Include another heap, prioritized after current items."""
+        if self.forest is None:
+            self.forest = Deque()
+        self.forest.append(heap)
+
+    def _include_before(self, heap):
+        """Include another heap, prioritized before current items."""
+        if self.forest is None:
+            self.forest = Deque()
+        self.forest.appendleft(heap)
+
+    def _link_with(self, latter, latter_less):
+        """Include latter heap or be included into it according to comparison, return the including heap."""
+        if latter_less:
+            latter._include_before(self)
+            return latter
+        self._include_after(latter)
+        return self
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "_WeakSubHeap(" + repr(self.top_ref) + ", " + repr(self.forest) + ")"
+
+
+def _spliced_alive(old_forest, alive=None):
+    """Return Deque of old_forest sub-heaps with alive tops and number of dead ones, emptying old_forest.
+
+    Each dead sub-heap is replaced by its own sub-heaps, in forest order,
+    as they were not less than the dead top.
+    If alive List is given, the alive top items are appended to it, keeping them alive.
+    """
+    new_forest = Deque()
+    dead = 0
+    while old_forest:
+        tree = old_forest.popleft()
+        top_item = tree.top_ref()
+        if top_item is None:
+            dead += 1
+            if tree.forest:
+                old_forest.extendleft(reversed(tree.forest))
+            continue
+        if alive is not None:
+            alive.append(top_item)
+        new_forest.append(tree)
+    return new_forest, dead
 
 
 class MutableStableLazyZigzagPairingWeakHeap(MutablePriorityWeakQueue):
@@ -31,120 +106,105 @@ class MutableStableLazyZigzagPairingWeakHeap(MutablePriorityWeakQueue):
     Pairing: Most subheap comparisons are on pairs of "equal" sub-heaps.
     Zigzag: The odd sub-heap is left at alternating ends.
 
-    This implementation uses Deque to store ordered collection of sub-heaps."""
+    This implementation uses Deque to store ordered collection of sub-heaps.
+    Each item gets one weak reference, with callback counting dead items.
+    Dead sub-heaps are dropped when they reach the top level forest,
+    or all at once when there are more of them than compaction_fraction of stored sub-heaps.
+    Extracted item's weak reference is dropped with its sub-heap, so its death is not counted."""
 
-    def __init__(self, top_item=None, forest=None):
-        """Initialize a queue."""
-        self.top_ref = _ref_or_none(top_item)
-        self.forest = forest if forest is not None else Deque()
+    def __init__(self, compaction_fraction=0.5):
+        """Initialize an empty queue."""
+        self.top_ref = None
+        self.forest = Deque()
+        self.tombstones = _TombstoneCounter()
+        self.stored = 0
+        self.compaction_fraction = compaction_fraction
 
     def ensure_top_demoted(self):
         """In case heap has a top, demote it so merge is easier."""
-        self.top_ref = _ref_or_none(self.top_ref)
         if self.top_ref is None:
             return
-        demoted = MutableStableLazyZigzagPairingWeakHeap(self.top_ref, self.forest, self.length)
+        # Weak reference is moved, not recreated.
+        demoted = _WeakSubHeap(self.top_ref, self.forest)
         self.top_ref = None
         self.forest = Deque([demoted])
 
     def add(self, item):
         """Add item to self, prioritized after current items, do not compare yet."""
         self.ensure_top_demoted()
-        self.forest.append(MutableStableLazyZigzagPairingWeakHeap(top_item=item))
-
-    def _include_after(self, heap):
-        """Include another heap, forest-ordered after current items."""
-        # Do not ensure top promoted, as it was the previous top who won comparison.
-        self.forest.append(heap)
-
-    def _include_before(self, heap):
-        """Include another heap, forest-ordered before current items."""
-        # Do not ensure top promoted, as it was the previous top who won comparison.
-        self.forest.appendleft(heap)
+        self.forest.append(_WeakSubHeap(ref(item, self.tombstones)))
+        self.stored += 1
+        if self.tombstones.count > self.compaction_fraction * self.stored:
+            self.prune_dead()
+
+    def _forget_dead(self, dead):
+        """Account for dead sub-heaps which are no longer stored."""
+        self.tombstones.count -= dead
+        self.stored -= dead
+
+    def prune_dead(self):
+        """Remove sub-heaps with dead tops from all levels, replacing each by its sub-heaps in forest order."""
+        if self.top_ref is not None and self.top_ref() is None:
+            self.top_ref = None
+            self._forget_dead(1)
+        self.forest, dead = _spliced_alive(self.forest)
+        # Explicit stack of sub-heaps to prune, as they can be nested deeply.
+        pending = List(self.forest)
+        while pending:
+            heap = pending.pop()
+            if not heap.forest:
+                continue
+            heap.forest, heap_dead = _spliced_alive(heap.forest)
+            dead += heap_dead
+            pending.extend(heap.forest)
+        self._forget_dead(dead)
 
     def peek(self):
         """Return least priority item or None if empty, this includes promoting top, but not extraction.
 
-        This also acts as ensure_top_promoted.
-
         Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade.
         Return the top item (not weakref) to make sure top stay promoted (instead of vanishing).
         """
-        top_item = _item_or_none(self.top_ref)
-        if (top_item is not None) or (not self.forest):
-            return top_item
-        # In order to prevent returning None on nonempty heap,
-        # we need to track any comparison winner, to prevent it from dying.
-        protected = None
-        while len(self.forest) > 1:
-            # zig
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                latter_heap = self.forest.pop()
-                former_heap = self.forest.pop()
-                # We need to peek and check for None as items might got deleted.
-                latter_item = latter_heap.peek()
-                former_item = former_heap.peek()
-                if latter_item is None:
-                    if former_item is None:
-                        continue
-                    else:
-                        self.forest.append(former_heap)
-                        continue
-                if former_item is None:
-                    self.forest.append(latter_heap)
-                    continue
-                if latter_item < former_item:
-                    protected = latter_item
-                    latter_heap._include_before(former_heap)
-                    new_forest.appendleft(latter_heap)
-                else:
-                    protected = former_item
-                    former_heap._include_after(latter_heap)
-                    new_forest.appendleft(former_heap)
-            if self.forest:
-                new_forest.appendleft(self.forest.pop())
-            self.forest = new_forest
-            # zag
-            new_forest = Deque()
-            while len(self.forest) > 1:
-                former_heap = self.forest.popleft()
-                latter_heap = self.forest.popleft()
-                former_item = former_heap.peek()
-                latter_item = latter_heap.peek()
-                if latter_item is None:
-                    if former_item is None:
-                        continue
-                    else:
-                        self.forest.appendleft(former_heap)
-                        continue
-                if former_item is None:
-                    self.forest.appendleft(latter_heap)
-                    continue
-                if latter_item < former_item:
-                    protected = latter_item
-                    latter_heap._include_before(former_heap)
-                    new_forest.append(latter_heap)
-                else:
-                    protected = former_item
-                    former_heap._include_after(latter_heap)
-                    new_forest.append(former_heap)
-            if self.forest:
-                new_forest.append(self.forest.pop())
-            self.forest = new_forest
-        new_state = self.forest.pop()
+        if self.top_ref is not None:
+            top_item = self.top_ref()
+            if top_item is not None:
+                return top_item
+            self.top_ref = None
+            self._forget_dead(1)
+        if self.tombstones.count > self.compaction_fraction * self.stored:
+            self.prune_dead()
+        # Alive tops are referenced from List, so none of them dies during the comparisons.
+        alive = List()
+        forest, dead = _spliced_alive(self.forest, alive)
+        self._forget_dead(dead)
+        if not forest:
+            self.forest = forest
+            return None
+        new_state = zigzag_promoted(forest)
         self.top_ref = new_state.top_ref
-        self.forest = new_state.forest
-        top_item = _item_or_none(self.top_ref)
-        return protected if top_item is None else top_item
+        self.forest = Deque() if new_state.forest is None else new_state.forest
+        return new_state.top_item
 
     def pop(self):
         """Extract the least item from self and return that, or None if empty."""
         item = self.peek()
-        self.top_ref = None
+        if item is not None:
+            self.top_ref = None
+            self.stored -= 1
         return item
 
 
+@keyed_sorted
 def mslzpwh_sorted(source):
     """Return new List of items, sorted using the mslzpw heap."""
     return sorted_using_mutable_stable_weak_heap(MutableStableLazyZigzagPairingWeakHeap, source)
+
+
+def mslzpwh_iter_sorted(source):
+    """Return generator of items in sorted order, popping them from the mslzpw heap only when requested."""
+    return iter_sorted_using_mutable_stable_weak_heap(MutableStableLazyZigzagPairingWeakHeap, source)
+
+
+def mslzpwh_smallest(k, source):
+    """Return List of k least items in sorted order, popping only k items from the mslzpw heap."""
+    return smallest_using_iter_sorted(mslzpwh_iter_sorted, k, source)
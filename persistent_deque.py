@@ -0,0 +1,62 @@
+"""Module that defines PersistentDeque, an immutable deque sharing structure between versions.
+
+Items are kept in two cons lists (nested (head, tail) tuples ending with None),
+front list in order and back list in reversed order,
+so both append and appendleft create a single cell and share the rest.
+Iteration is linear in length, as it has to reverse the back list.
+"""
+
+from pep_3140 import List
+
+
+class PersistentDeque(object):
+    """Immutable ordered collection with O(1) append and appendleft returning new deques."""
+
+    __slots__ = ("front", "back", "length")
+
+    def __init__(self, iterable=(), front=None, back=None, length=0):
+        """Initialize from iterable, or from cons lists of known total length."""
+        for item in iterable:
+            back = (item, back)
+            length += 1
+        self.front = front
+        self.back = back
+        self.length = length
+
+    def append(self, item):
+        """Return new deque with item added at the end."""
+        return PersistentDeque(front=self.front, back=(item, self.back), length=self.length + 1)
+
+    def appendleft(self, item):
+        """Return new deque with item added at the start."""
+        return PersistentDeque(front=(item, self.front), back=self.back, length=self.length + 1)
+
+    def __len__(self):
+        """Return number of items."""
+        return self.length
+
+    def __bool__(self):
+        """Return whether there are any items."""
+        return self.length > 0
+
+    def __iter__(self):
+        """Iterate over items from the start to the end."""
+        cell = self.front
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1]
+        reversed_back = List()
+        cell = self.back
+        while cell is not None:
+            reversed_back.append(cell[0])
+            cell = cell[1]
+        reversed_back.reverse()
+        yield from reversed_back
+
+    def __str__(self):
+        """Return str of List corresponding to self."""
+        return str(List(self))
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "PersistentDeque(" + repr(List(self)) + ")"
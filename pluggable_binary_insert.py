@@ -1,8 +1,15 @@
 """Module that defines binary insert operation using pluggable pivoting strategy."""
 
+from pep_3140 import Dict
+from pep_3140 import List
+
+
+# Pivot offset Lists, keyed by the choose_pivot function they were computed from.
+_pivot_offsets_cache = Dict()
+
 
 def mutating_pluggable_binary_insert(choose_pivot, element, target, lower_index, upper_index):
-    """Insert element into target list.
+    """Insert element into target list (or other sequence supporting insert).
 
     Lower index is confirmed to be before, can be -1;
     Upper index is confirmed to be after, can be len(target).
@@ -11,15 +18,61 @@ def mutating_pluggable_binary_insert(choose_pivot, element, target, lower_index,
     TODO: Will there be pivoting strategies depending on more than just spread?
 
     In case of tie, element is inserted to upper part.
-    Return None as this is operation mutates target.
+    Return index at which the element was inserted.
     """
     spread = upper_index - lower_index
     assert spread > 0, "Binary insert encountered non-positive window size."
     if spread <= 1:
-        target[upper_index:upper_index] = [element]
-        return
+        target.insert(upper_index, element)
+        return upper_index
     pivot_index = choose_pivot(lower_index, upper_index)
     if element < target[pivot_index]:
-        mutating_pluggable_binary_insert(choose_pivot, element, target, lower_index, pivot_index)
-    else:
-        mutating_pluggable_binary_insert(choose_pivot, element, target, pivot_index, upper_index)
+        return mutating_pluggable_binary_insert(choose_pivot, element, target, lower_index, pivot_index)
+    return mutating_pluggable_binary_insert(choose_pivot, element, target, pivot_index, upper_index)
+
+
+def extend_pivot_offsets(choose_pivot, pivot_offsets, spread):
+    """Make sure pivot_offsets List covers the spread, growing it at least twice.
+
+    Item at index spread is choose_pivot(lower_index, upper_index) - lower_index
+    for upper_index - lower_index == spread, items for spreads below 2 are unused zeros.
+    This assumes the pivot offset depends only on spread.
+    """
+    if not pivot_offsets:
+        pivot_offsets.extend([0, 0])
+    len_offsets = len(pivot_offsets)
+    if spread < len_offsets:
+        return
+    pivot_offsets.extend(choose_pivot(0, index) for index in range(len_offsets, max(spread + 1, 2 * len_offsets)))
+
+
+def cached_pivot_offsets(choose_pivot, spread):
+    """Return module-level pivot offsets List for choose_pivot, extended to cover the spread if needed."""
+    pivot_offsets = _pivot_offsets_cache.get(choose_pivot)
+    if pivot_offsets is None:
+        pivot_offsets = _pivot_offsets_cache[choose_pivot] = List()
+    if spread >= len(pivot_offsets):
+        extend_pivot_offsets(choose_pivot, pivot_offsets, spread)
+    return pivot_offsets
+
+
+def mutating_scheduled_binary_insert(pivot_offsets, element, target, lower_index, upper_index):
+    """Insert element into target list (or other sequence supporting insert).
+
+    Iterative equivalent of mutating_pluggable_binary_insert,
+    pivot offsets are read from pivot_offsets List indexed by spread,
+    which has to cover upper_index - lower_index already.
+    The probe sequence is the same as with the choose_pivot the table was computed from.
+
+    In case of tie, element is inserted to upper part.
+    Return index at which the element was inserted.
+    """
+    assert upper_index > lower_index, "Binary insert encountered non-positive window size."
+    while upper_index - lower_index > 1:
+        pivot_index = lower_index + pivot_offsets[upper_index - lower_index]
+        if element < target[pivot_index]:
+            upper_index = pivot_index
+        else:
+            lower_index = pivot_index
+    target.insert(upper_index, element)
+    return upper_index
@@ -2,14 +2,21 @@
 
 from pep_3140 import Deque
 from pep_3140 import List
+from pep_3140 import Tuple
 from comparable_payload import ComparablePayload
+from ford_johnson_plan import count_inserted
+from ford_johnson_plan import ford_johnson_plan
 
 
-def pluggable_ford_johnson_sort(mutating_insert, original_source):
+def pluggable_ford_johnson_sort(mutating_insert, original_source, target_class=List, oracle=None):
     """Form pairs and sort them according to top elements (odd element at the end).
     Binary-insert dangling elements in an order that maximizes efficiency.
+    Jacobsthal groups come from cached ford_johnson_plan, current positions of anchors
+    are tracked in a FenwickTree, so mutating_insert has to return the index it inserted at.
 
     Original_source should be iterable supporting len() and element should support comparison.
+    Target_class is used to construct insertion targets, BlockedList is cheaper to insert into for long sources.
+    Optional oracle gets pairing comparisons of each level as one batch, see zigzag_pairing for the interface.
     Returned value is either the original, or a new List.
     This sort is functional, in sense it does not modify original source.
     """
@@ -17,48 +24,37 @@ def pluggable_ford_johnson_sort(mutating_insert, original_source):
         return original_source
     source = Deque(original_source)
     pairs = List()
+    if oracle is not None:
+        former_wins = Deque(oracle(List([Tuple((source[index + 1], source[index])) for index in range(0, len(source) - 1, 2)])))
     while len(source) > 1:
         former = source.popleft()
         latter = source.popleft()
-        if former > latter:
+        if former_wins.popleft() if oracle is not None else former > latter:
             pairs.append(ComparablePayload(former, latter))
         else:
             pairs.append(ComparablePayload(latter, former))
-    pairs = pluggable_ford_johnson_sort(mutating_insert, pairs)
+    pairs = pluggable_ford_johnson_sort(mutating_insert, pairs, target_class, oracle)
     len_pairs = len(pairs)
     # Additional index payload is needed for localizing anchors.
     first_item = ComparablePayload(pairs[0].payload, 0)
     second_item = ComparablePayload(pairs[0].key, 0)
-    indexed_target = List([first_item, second_item])
-    jacobsthal_previous = 1
-    jacobsthal_current = 1
-    while jacobsthal_current < len_pairs:
-        jacobsthal_backup = jacobsthal_previous
-        jacobsthal_previous = jacobsthal_current
-        jacobsthal_current = jacobsthal_previous + 2 * jacobsthal_backup
-        jacobsthal_backup = jacobsthal_current
-        if jacobsthal_current > len_pairs:
-            jacobsthal_current = len_pairs
+    indexed_target = target_class([first_item, second_item])
+    plan = ford_johnson_plan(len_pairs)
+    anchor_positions = plan.anchor_positions.copy()
+    for jacobsthal_previous, jacobsthal_current, leeway in plan.groups:
         for index in range(len_pairs)[jacobsthal_previous:jacobsthal_current]:
             indexed_target.append(ComparablePayload(pairs[index].key, index))
-        if jacobsthal_backup > len_pairs:
+        if leeway:
             # We have a leeway, we can discount the cost of inserting the odd element.
             if len(source):
-                mutating_insert(ComparablePayload(source.popleft(), 0), indexed_target, -1, len(indexed_target))
-        upper_index = len(indexed_target) - 1
+                inserted_index = mutating_insert(ComparablePayload(source.popleft(), 0), indexed_target, -1, len(indexed_target))
+                count_inserted(anchor_positions, inserted_index)
         for index in range(len_pairs)[jacobsthal_current - 1:jacobsthal_previous - 1:-1]:
-            while indexed_target[upper_index].payload != index:
-                upper_index -= 1
-                assert upper_index >= 0, ("jacobsthal_current: " + str(jacobsthal_current) + '\n' +
-                                          "jacobsthal_previous: " + str(jacobsthal_previous) + '\n' +
-                                          "jacobsthal_backup: " + str(jacobsthal_backup) + '\n' +
-                                          "len_pairs: " + str(len_pairs) + '\n' + "index: " + str(index) + '\n' +
-                                          "len_indexed_target: " + str(len(indexed_target)) + '\n' +
-                                          "indexed_target: " + str(List([str(List([item.payload, item.key])) for item in indexed_target])) + '\n' +
-                                          "pairs: " + str(List([str(List([index, pair.key])) for (index, pair) in enumerate(pairs)]))
-                                         )
-            mutating_insert(ComparablePayload(pairs[index].payload, 0), indexed_target, -1, upper_index)
-    bare_target = List([item.key for item in indexed_target])
+            upper_index = anchor_positions.prefix_sum(2 * index + 2) - 1
+            assert indexed_target[upper_index].payload == index, "Anchor not found at expected position."
+            inserted_index = mutating_insert(ComparablePayload(pairs[index].payload, 0), indexed_target, -1, upper_index)
+            count_inserted(anchor_positions, inserted_index)
+    bare_target = target_class([item.key for item in indexed_target])
     if len(source):
         mutating_insert(source.popleft(), bare_target, -1, len(bare_target))
-    return bare_target
+    return bare_target if target_class is List else List(bare_target)
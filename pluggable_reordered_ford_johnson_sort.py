@@ -2,17 +2,28 @@
 
 from pep_3140 import Deque
 from pep_3140 import List
+from pep_3140 import Tuple
 from comparable_payload import ComparablePayload
+from ford_johnson_plan import count_inserted
+from ford_johnson_plan import efficiency_key
+from ford_johnson_plan import ford_johnson_plan
+from ford_johnson_plan import most_efficient_pending
 
 
-def pluggable_reordered_ford_johnson_sort(mutating_insert, original_source):
+def pluggable_reordered_ford_johnson_sort(mutating_insert, original_source, target_class=List, oracle=None):
     """Form pairs and sort them according to top elements (odd element at the end).
     Binary-insert dangling elements in an order that maximizes efficiency.
 
     The order takes into account placement of previous inserts,
     basically it can change order of inserts to differ from the Jacobsthal one.
+    Each insert is below the pending anchor (or at the end for the odd element)
+    at the target index with the best efficiency, see efficiency_key.
+    Anchor indexes are tracked in FenwickTree copied from cached ford_johnson_plan,
+    so mutating_insert has to return the index it inserted at.
 
     Original_source should be iterable supporting len() and element should support comparison.
+    Target_class is used to construct insertion target, BlockedList is cheaper to insert into for long sources.
+    Optional oracle gets pairing comparisons of each level as one batch, see zigzag_pairing for the interface.
     Returned value is either the original, or a new List.
     This sort is functional, in sense it does not modify original source.
     """
@@ -21,45 +32,34 @@ def pluggable_reordered_ford_johnson_sort(mutating_insert, original_source):
         return original_source
     source = Deque(original_source)
     pairs = List()
+    if oracle is not None:
+        former_wins = Deque(oracle(List([Tuple((source[index + 1], source[index])) for index in range(0, len(source) - 1, 2)])))
     while len(source) > 1:
         former = source.popleft()
         latter = source.popleft()
-        if former > latter:
+        if former_wins.popleft() if oracle is not None else former > latter:
             pairs.append(ComparablePayload(former, latter))
         else:
             pairs.append(ComparablePayload(latter, former))
     odd_item = None if len(source) < 1 else source.pop()
-    pairs = pluggable_reordered_ford_johnson_sort(mutating_insert, pairs)
-    # Additional index payload is needed for localizing anchors.
-    first_item = ComparablePayload(pairs[0].payload, 0)
-    second_item = ComparablePayload(pairs[0].key, 0)
-    indexed_target = List([first_item, second_item])
-    danglers = List([None])  # to align indexes
-    # pairs[].key could be re-used for danglers, byt that would be more error-prone.
-    for index, pair in list(enumerate(pairs))[1:]:
-        # Nonzero index means that item dangling under anchor was not inserted yet.
-        indexed_target.append(ComparablePayload(pair.key, index))
-        danglers.append(pair.payload)
-    efficiency_list = List()
-    for index in range(2, len_original_source):
-        bits = len(bin(index)) - 2
-        efficiency_list.append(ComparablePayload(-1.0 * (index + 1) / (1 << bits), index))
-    efficiency_list = sorted(efficiency_list)
-    for _ in range(len_original_source - len(indexed_target)):
-        len_target = len(indexed_target)
-        for efficiency_item in efficiency_list:
-            anchor_index = efficiency_item.payload
-            if anchor_index < len_target:
-                anchor = indexed_target[anchor_index]
-                dangler_index = anchor.payload
-                if dangler_index > 0:
-                    anchor.payload = 0
-                    mutating_insert(ComparablePayload(danglers[dangler_index], 0), indexed_target, -1, anchor_index)
-                    break
-            elif anchor_index == len_target:
-                if odd_item is not None:
-                    mutating_insert(ComparablePayload(odd_item, 0), indexed_target, -1, len_target)
-                    odd_item = None
-                    break
-    assert len(indexed_target) == len_original_source
-    return List([item.key for item in indexed_target])
+    pairs = pluggable_reordered_ford_johnson_sort(mutating_insert, pairs, target_class, oracle)
+    len_pairs = len(pairs)
+    target = target_class([pairs[0].payload])
+    target.extend(pair.key for pair in pairs)
+    plan = ford_johnson_plan(len_pairs)
+    anchor_positions = plan.anchor_positions.copy()
+    # Dangler under anchor of nonzero rank was not inserted yet.
+    pending = plan.pending.copy()
+    for _ in range(len_original_source - len(target)):
+        len_target = len(target)
+        best = most_efficient_pending(anchor_positions, pending, len_target)
+        if odd_item is not None and (best is None or efficiency_key(len_target) < best):
+            inserted_index = mutating_insert(odd_item, target, -1, len_target)
+            odd_item = None
+        else:
+            _, anchor_index, rank = best
+            pending.add(rank, -1)
+            inserted_index = mutating_insert(pairs[rank].payload, target, -1, anchor_index)
+        count_inserted(anchor_positions, inserted_index)
+    assert len(target) == len_original_source
+    return target if target_class is List else List(target)
@@ -1,13 +1,22 @@
 """Module collecting utilities for testing sorted-compatible algorithms."""
 
+import importlib
 import logging
+import os
 import random
+import subprocess
 import sys
+import tempfile
 
 from pep_3140 import List
+from comparable_payload import ComparablePayload
 from comparison_logging_wrapper import ComparisonLoggingWrapper
 from comparison_counting_wrapper import ComparisonCountingWrapper
 from comparison_counting_wrapper import SimpleCounter
+from comparison_inferring_wrapper import ComparisonInferringWrapper
+from comparison_inferring_wrapper import ComparisonStore
+from comparison_journal import ComparisonJournal
+from comparison_journal import JournaledComparisonWrapper
 from interactive_comparison_wrapper import InteractiveComparisonWrapper
 
 # FIXME: Replace this with introspectable logger, to avoid eye-independent tests.
@@ -39,7 +48,259 @@ def counting_test(sort, size, seed=42):
     assert result == List(range(size)), str(result)
     return counter.count
 
-def interactive_test(sort):
+def inferring_test(sort, size, seed=42):
+    """Sort random shuffle with counting wrapper inside inferring wrapper, print and return the count."""
+    print(f"Inferring test on length {size}")
+    random.seed(seed)
+    source = List(range(size))
+    random.shuffle(source)
+    counter = SimpleCounter()
+    store = ComparisonStore()
+    wrapped_source = List([ComparisonInferringWrapper(ComparisonCountingWrapper(value, counter), store) for value in source])
+    result = List([item.value.value for item in sort(wrapped_source)])
+    print(f"used {counter.count} comparisons, {store}.")
+    assert result == List(range(size)), str(result)
+    assert counter.count == store.delegated, str(store)
+    return counter.count
+
+def keyed_test(sort, size, seed=42):
+    """Sort random items with duplicate keys using key and reverse, compare to stable sorted(), check key calls."""
+    print(f"Keyed test on length {size}")
+    random.seed(seed)
+    source = List([ComparablePayload(random.randrange(size), index) for index in range(size)])
+    counter = SimpleCounter()
+    def key(item):
+        """Return the key modulo 7, incrementing counter."""
+        counter.count += 1
+        return item.key % 7
+    for reverse in (False, True):
+        counter.count = 0
+        result = List([item.payload for item in sort(source, key=key, reverse=reverse)])
+        assert counter.count == size, str(counter.count)
+        assert result == List([item.payload for item in sorted(source, key=key, reverse=reverse)]), str(result)
+    result = List([item.payload for item in sort(source, reverse=True)])
+    assert result == List([item.payload for item in sorted(source, reverse=True)]), str(result)
+
+def streaming_test(iter_sorted, smallest, size=100, seed=42):
+    """Check iter_sorted and smallest against sorted(), and that k smallest need fewer comparisons than all."""
+    print(f"Streaming test on length {size}")
+    random.seed(seed)
+    source = List(range(size))
+    random.shuffle(source)
+    counter = SimpleCounter()
+    wrapped_source = List([ComparisonCountingWrapper(value, counter) for value in source])
+    result = List([item.value for item in iter_sorted(wrapped_source)])
+    assert result == List(range(size)), str(result)
+    full_count = counter.count
+    for k in (0, 1, size // 10, size + 1):
+        counter.count = 0
+        result = List([item.value for item in smallest(k, wrapped_source)])
+        assert result == List(range(min(k, size))), str(result)
+        print(f"{k} smallest used {counter.count} comparisons, all used {full_count}.")
+        assert k >= size or counter.count < full_count, str(counter.count)
+
+def deletable_test(heap_class, size=100, seed=42):
+    """Check deletions of the top, of stored items and before add, against sorted() of the remaining items."""
+    print(f"Deletable test on length {size}")
+    random.seed(seed)
+    source = List(range(size))
+    random.shuffle(source)
+    heap = heap_class()
+    # Delete before add: the add is cancelled.
+    heap.delete(source[0])
+    for value in source:
+        heap.add(value)
+    remaining = set(source[1:])
+    # Delete of top: the next item is promoted instead.
+    top = heap.peek()
+    heap.delete(top)
+    remaining.discard(top)
+    assert heap.peek() == min(remaining), str(heap.peek())
+    for value in source[::3]:
+        heap.delete(value)
+        remaining.discard(value)
+    result = List()
+    while 1:
+        item = heap.pop()
+        if item is None:
+            break
+        result.append(item)
+    assert result == sorted(remaining), str(result)
+    assert heap.pop() is None
+    # Duplicates: each deletion removes one occurrence.
+    heap = heap_class()
+    for value in (5, 5, 7, 8):
+        heap.add(value)
+    heap.delete(5)
+    heap.delete(5)
+    result = List([heap.pop(), heap.pop(), heap.pop()])
+    assert result == [7, 8, None], str(result)
+    heap = heap_class()
+    source = List([random.randrange(size // 4) for _ in range(size)])
+    for value in source:
+        heap.add(value)
+    remaining = List(source)
+    for value in source[::2]:
+        heap.delete(value)
+        remaining.remove(value)
+    result = List()
+    while 1:
+        item = heap.pop()
+        if item is None:
+            break
+        result.append(item)
+    assert result == sorted(remaining), str(result)
+
+def decrease_key_test(heap_class, size=100, seed=42):
+    """Run Dijkstra on random graph using add handles and decrease_key, compare distances to Bellman-Ford."""
+    print(f"Decrease key test on {size} vertices")
+    random.seed(seed)
+    edges = List([(random.randrange(size), random.randrange(size), random.randrange(100)) for _ in range(size * 5)])
+    expected = [0] + [None] * (size - 1)
+    for _ in range(size):
+        for start, stop, weight in edges:
+            if expected[start] is not None and (expected[stop] is None or expected[start] + weight < expected[stop]):
+                expected[stop] = expected[start] + weight
+    distances = [None] * size
+    handles = {}
+    heap = heap_class()
+    handles[0] = heap.add(ComparablePayload(0, 0), with_handle=True)
+    # Counted by the test, as not every heap has len.
+    stored = 1
+    while stored:
+        item = heap.pop()
+        stored -= 1
+        distance, vertex = item.key, item.payload
+        distances[vertex] = distance
+        for start, stop, weight in edges:
+            if start != vertex or distances[stop] is not None:
+                continue
+            if stop not in handles:
+                handles[stop] = heap.add(ComparablePayload(distance + weight, stop), with_handle=True)
+                stored += 1
+            elif distance + weight < handles[stop].item.key:
+                heap.decrease_key(handles[stop], ComparablePayload(distance + weight, stop))
+    assert distances == expected, str(distances)
+    assert heap.vacated == 0 and not heap.forest, str(heap.vacated)
+    # Drain heaps with decreased keys, vacated sub-heaps should be gone once all items are popped.
+    heap = heap_class()
+    heap.add(3, with_handle=True)
+    handle = heap.add(4, with_handle=True)
+    heap.peek()
+    heap.decrease_key(handle, 1)
+    assert (heap.pop(), heap.pop()) == (1, 3)
+    assert heap.vacated == 0 and not heap.forest, str(heap.vacated)
+    for _ in range(size):
+        heap = heap_class()
+        values = List([random.randrange(size) for _ in range(random.randrange(1, 20))])
+        handles = List([heap.add(value, with_handle=True) for value in values])
+        for _ in range(random.randrange(len(values) * 2)):
+            index = random.randrange(len(values))
+            if random.random() < 0.3:
+                heap.peek()
+            values[index] -= random.randrange(size)
+            heap.decrease_key(handles[index], values[index])
+        result = List([heap.pop() for _ in values])
+        assert result == sorted(values), str(result)
+        assert heap.vacated == 0 and not heap.forest, str(heap.vacated)
+
+class InterruptingCounter(SimpleCounter):
+    """A counter raising InterruptedError when count exceeds the limit, simulating a crash."""
+
+    def __init__(self, limit):
+        """Initialization with the limit."""
+        self.limit = limit
+        super().__init__()
+
+    @property
+    def count(self):
+        """Return the count."""
+        return self._count
+
+    @count.setter
+    def count(self, value):
+        """Set the count, raise if above the limit."""
+        if value > self.limit:
+            raise InterruptedError(f"Interrupted after {self.limit} comparisons.")
+        self._count = value
+
+def journal_identity(item):
+    """Return identity of a counting wrapper for the journal, repr of the wrapped value."""
+    return repr(item.value)
+
+def shuffled_source(size, seed):
+    """Return List of range(size) shuffled with the seed."""
+    random.seed(seed)
+    source = List(range(size))
+    random.shuffle(source)
+    return source
+
+def interrupted_journal_run(sort, size, seed, path, limit):
+    """Sort shuffled source journaled at path, interrupted after limit delegated comparisons."""
+    counter = InterruptingCounter(limit)
+    with ComparisonJournal(path) as journal:
+        wrapped_source = List([JournaledComparisonWrapper(ComparisonCountingWrapper(value, counter), journal, identity_function=journal_identity) for value in shuffled_source(size, seed)])
+        try:
+            sort(wrapped_source)
+        except InterruptedError:
+            pass
+
+def restarted_journal_run(sort, size, seed, path, limit, total):
+    """Sort shuffled source journaled at path, check only the comparisons missing from the journal are delegated."""
+    counter = SimpleCounter()
+    with ComparisonJournal(path) as journal:
+        assert len(journal) == min(limit, total), str(len(journal))
+        wrapped_source = List([JournaledComparisonWrapper(ComparisonCountingWrapper(value, counter), journal, identity_function=journal_identity) for value in shuffled_source(size, seed)])
+        result = List([item.value.value for item in sort(wrapped_source)])
+        print(f"used {counter.count} comparisons after restart, {journal}.")
+    assert result == List(range(size)), str(result)
+    assert counter.count == total - min(limit, total), str(counter.count)
+
+def journal_test(sort, size, seed=42):
+    """Interrupt a journaled sort midway, check the restarted sort only delegates the remaining comparisons."""
+    print(f"Journal test on length {size}")
+    total = counting_test(sort, size, seed)
+    limit = total // 2
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "journal")
+        with ComparisonJournal(path) as journal:
+            try:
+                # Default object repr contains a memory address, so it is no identity.
+                JournaledComparisonWrapper(ComparisonCountingWrapper(0, SimpleCounter()), journal)
+                assert False, "Unstable identity accepted."
+            except ValueError:
+                pass
+        interrupted_journal_run(sort, size, seed, path, limit)
+        restarted_journal_run(sort, size, seed, path, limit, total)
+
+def journal_reopen_test(module_name, sort_name, size, seed=42):
+    """Interrupt a journaled sort in a child process, check the restarted sort here only delegates the remaining comparisons.
+
+    The child is a fresh interpreter, so identities have to be stable across runs, not only within one.
+    """
+    print(f"Journal reopen test on length {size}")
+    sort = getattr(importlib.import_module(module_name), sort_name)
+    total = counting_test(sort, size, seed)
+    limit = total // 2
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "journal")
+        code = (
+            "import importlib, sys\n"
+            "from pluggable_test import interrupted_journal_run\n"
+            "module_name, sort_name, size, seed, path, limit = sys.argv[1:]\n"
+            "sort = getattr(importlib.import_module(module_name), sort_name)\n"
+            "interrupted_journal_run(sort, int(size), int(seed), path, int(limit))\n"
+        )
+        arguments = [module_name, sort_name, str(size), str(seed), path, str(limit)]
+        subprocess.run([sys.executable, "-c", code] + arguments, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        restarted_journal_run(sort, size, seed, path, limit, total)
+
+def interactive_test(sort, infer=False, journal_path=None):
+    """Sort identifiers entered by user, asking for comparisons.
+
+    If infer, do not ask for implied results.
+    If journal_path is given, answers are journaled there and replayed when the test is restarted.
+    """
     items = List()
     while 1:
         item = input("Next identifier, empty for end of list to sort: ")
@@ -51,13 +312,25 @@ def interactive_test(sort):
             items.append(item)
             print(f"Ok, {len(items)} items so far.")
     wrapped = List([InteractiveComparisonWrapper(item) for item in items])
+    if journal_path is not None:
+        journal = ComparisonJournal(journal_path)
+        print(f"Journal has {len(journal)} answers.")
+        wrapped = List([JournaledComparisonWrapper(item, journal, item.value) for item in wrapped])
+    if infer:
+        store = ComparisonStore()
+        wrapped = List([ComparisonInferringWrapper(item, store) for item in wrapped])
     print("Sorting starts")
     result = List([item.value for item in sort(wrapped)])
+    if infer:
+        result = List([item.value for item in result])
+    if journal_path is not None:
+        result = List([item.value for item in result])
+        journal.close()
     print("Sorted, listing in order:")
     for value in result:
         print(f"{value}")
 
-def suite(sort, scale=100, seed=42):
+def suite(sort, scale=100, seed=42, keyed=False):
     verbose_test(sort, [])
     verbose_test(sort, [0])
     verbose_test(sort, [0, 1])
@@ -68,4 +341,8 @@ def suite(sort, scale=100, seed=42):
     for size in range(scale):
         count += counting_test(sort, size)
     print(f"Total count needed for scale tests: {count}")
+    inferring_test(sort, scale)
+    journal_test(sort, scale)
+    if keyed:
+        keyed_test(sort, scale)
     interactive_test(sort)
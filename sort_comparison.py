@@ -9,6 +9,7 @@ from comparison_counting_wrapper import ComparisonCountingWrapper
 from comparison_counting_wrapper import SimpleCounter
 from mutable_stable_counting_lazy_zigzag_pairing_heap import msclzph_sorted
 from mutable_stable_lazy_zigzag_pairing_heap import mslzph_sorted
+from mutable_stable_arena_lazy_zigzag_pairing_heap import msalzph_sorted
 from mutable_stable_lazy_zigzag_pairing_weak_heap import mslzpwh_sorted
 from mutable_stable_deletable_lazy_zigzag_pairing_heap import msdlzph_sorted
 from functional_stable_counting_lazy_zigzag_pairing_heap import fsclzph_sorted
@@ -18,6 +19,7 @@ from mutable_inclusion_preferring_lazy_zigzag_pairing_heap import miplzph_sorted
 from mutable_lazy_weight_linking_heap import mlwlh_sorted
 from halving_ford_johnson_sort import hfj_sorted
 from complete_ford_johnson_sort import cfj_sorted
+from blocked_complete_ford_johnson_sort import bcfj_sorted
 from reordered_ford_johnson_sort import rfj_sorted
 
 
@@ -100,12 +102,14 @@ sorts_input = (
     (sorted, 2, "timsort"),
     (rfj_sorted, 20, "rfj"),
     (cfj_sorted, 16, "cfj"),
+    (bcfj_sorted, 16, "bcfj"),
     (hfj_sorted, 4, "hfj"),
     (mlwlh_sorted, 2, "mlwlh"),
     (mciplzph_sorted, 2, "mciplzph"),
     (miplzph_sorted, 2, "miplzph"),
     (msclzph_sorted, 2, "msclzph"),
     (mslzph_sorted, 2, "mslzph"),
+    (msalzph_sorted, 2, "msalzph"),
     (msdlzph_sorted, 2, "msdlzph"),
     (mslzpwh_sorted, 2, "mslzpwh"),
     (fsclzph_sorted, 2, "fsclzph"),
@@ -3,35 +3,71 @@
 Curently functions return sorted List.
 Alternative would be to return function which performs sorted,
 but that way is less friendly for adding debug logging.
+
+Iter_sorted functions are generators, popping items only as they are requested,
+so consuming only the first k items of lazy heaps costs only k pops.
 """
 
+from itertools import islice
+
+from stabilize_sorted import stabilize_pluggable_iter_sorted
 from stabilize_sorted import stabilize_pluggable_sorted
 from pep_3140 import List
 
 
-def sorted_using_mutable_stable_counting_heap(heap_class, source):
-    """Put items in heap, create List py popping them."""
+def _filled_mutable_heap(heap_class, source):
+    """Return heap with items of source, using from_iterable if heap_class has it."""
+    from_iterable = getattr(heap_class, "from_iterable", None)
+    if from_iterable is not None:
+        return from_iterable(source)
     heap = heap_class()
     for item in source:
         heap.add(item)
-    result = List()
+    return heap
+
+
+def smallest_using_iter_sorted(iter_sorted, k, source):
+    """Return List of (at most) k least items in sorted order, consuming only k items from iter_sorted(source)."""
+    return List(islice(iter_sorted(source), k))
+
+
+def iter_sorted_using_mutable_stable_counting_heap(heap_class, source):
+    """Put items in heap, yield them by popping."""
+    heap = _filled_mutable_heap(heap_class, source)
     while heap:
-        result.append(heap.pop())
-    return result
+        yield heap.pop()
 
 
-def sorted_using_mutable_stable_heap(heap_class, source):
-    """Put items in heap, create List py popping them."""
-    heap = heap_class()
-    for item in source:
-        heap.add(item)
-    result = List()
+def iter_sorted_using_mutable_stable_heap(heap_class, source):
+    """Put items in heap, yield them by popping."""
+    heap = _filled_mutable_heap(heap_class, source)
     while 1:
         item = heap.pop()
         if item is None:
-            break
-        result.append(item)
-    return result
+            return
+        yield item
+
+
+def sorted_using_mutable_stable_counting_heap(heap_class, source):
+    """Put items in heap, create List py popping them."""
+    return List(iter_sorted_using_mutable_stable_counting_heap(heap_class, source))
+
+
+def sorted_using_mutable_stable_heap(heap_class, source):
+    """Put items in heap, create List py popping them."""
+    return List(iter_sorted_using_mutable_stable_heap(heap_class, source))
+
+
+@stabilize_pluggable_iter_sorted
+def iter_sorted_using_mutable_unstable_counting_heap(heap_class, source):
+    """Stabilized unstable iter_sorted using mutable heap class."""
+    return iter_sorted_using_mutable_stable_counting_heap(heap_class, source)
+
+
+@stabilize_pluggable_iter_sorted
+def iter_sorted_using_mutable_unstable_heap(heap_class, source):
+    """Stabilized unstable iter_sorted using mutable heap class."""
+    return iter_sorted_using_mutable_stable_heap(heap_class, source)
 
 
 @stabilize_pluggable_sorted
@@ -46,30 +82,36 @@ def sorted_using_mutable_unstable_heap(heap_class, source):
     return sorted_using_mutable_stable_heap(heap_class, source)
 
 
-def sorted_using_functional_stable_counting_heap(heap_class, source):
-    """Put items in heap, create List py popping them."""
+def iter_sorted_using_functional_stable_counting_heap(heap_class, source):
+    """Put items in heap, yield them by popping."""
     heap = heap_class()
     for item in source:
         heap = heap.add(item)
-    result = List()
     while heap:
         heap, item = heap.pop()
-        result.append(item)
-    return result
+        yield item
 
 
-def sorted_using_functional_stable_heap(heap_class, source):
-    """Put items in heap, create List py popping them."""
+def iter_sorted_using_functional_stable_heap(heap_class, source):
+    """Put items in heap, yield them by popping."""
     heap = heap_class()
     for item in source:
         heap = heap.add(item)
-    result = List()
     while 1:
         heap, item = heap.pop()
         if item is None:
-            break
-        result.append(item)
-    return result
+            return
+        yield item
+
+
+def sorted_using_functional_stable_counting_heap(heap_class, source):
+    """Put items in heap, create List py popping them."""
+    return List(iter_sorted_using_functional_stable_counting_heap(heap_class, source))
+
+
+def sorted_using_functional_stable_heap(heap_class, source):
+    """Put items in heap, create List py popping them."""
+    return List(iter_sorted_using_functional_stable_heap(heap_class, source))
 
 
 @stabilize_pluggable_sorted
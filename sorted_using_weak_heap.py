@@ -1,6 +1,6 @@
 """Module that defines functions for creating sorted from weak heap.
 
-Curently functions return sorted List.
+Curently functions return sorted List, or generator for iter_sorted.
 Alternative would be to return function which performs sorted,
 but that way is less friendly for adding debug logging.
 """
@@ -9,18 +9,25 @@ but that way is less friendly for adding debug logging.
 from pep_3140 import List
 
 
-def sorted_using_mutable_stable_weak_heap(heap_class, source):
-    """Put items in heap, create List py popping them."""
+def iter_sorted_using_mutable_stable_weak_heap(heap_class, source):
+    """Put items in heap, yield them by popping.
+
+    Items are kept alive by a List referenced until the generator is exhausted.
+    """
+    source = List(source)
     heap = heap_class()
     for item in source:
         heap.add(item)
-    result = List()
     while 1:
         item = heap.pop()
         if item is None:
-            break
-        result.append(item)
-    return result
+            return
+        yield item
+
+
+def sorted_using_mutable_stable_weak_heap(heap_class, source):
+    """Put items in heap, create List py popping them."""
+    return List(iter_sorted_using_mutable_stable_weak_heap(heap_class, source))
 
 
 # TODO: The following will not work until we have self-removing Comparable.
@@ -1,5 +1,8 @@
 """Module that defines stabilize_sorted decorator applicable to unstable sorted() candidates.
 
+Stabilized functions accept unique keyword argument,
+if true the source is promised to contain no equal items, so no decoration is needed.
+
 TODO: Do we care to make this work with sort based on weak queues?
 """
 
@@ -10,8 +13,10 @@ from pep_3140 import List
 def stabilize_sorted(unstably_sorted):
     """Return function which applies Decorate+Sort+Undecorate around the argument function."""
 
-    def stabilized_sorted(source_iterable):
+    def stabilized_sorted(source_iterable, unique=False):
         """Decorate, call unstable_sorted, undecorate and return the resulting List."""
+        if unique:
+            return List(unstably_sorted(List(source_iterable)))
         decorated_list = List([ComparableSecondary(key, index) for index, key in enumerate(source_iterable)])
         return List([item.key for item in unstably_sorted(decorated_list)])
 
@@ -21,9 +26,26 @@ def stabilize_sorted(unstably_sorted):
 def stabilize_pluggable_sorted(pluggable_unstably_sorted):
     """Return function which applies Decorate+Sort+Undecorate around the argument function."""
 
-    def stabilized_pluggable_sorted(plugin, source_iterable):
+    def stabilized_pluggable_sorted(plugin, source_iterable, unique=False):
         """Decorate, call unstable_sorted, undecorate and return the resulting List."""
+        if unique:
+            return List(pluggable_unstably_sorted(plugin, List(source_iterable)))
         decorated_list = List([ComparableSecondary(key, index) for index, key in enumerate(source_iterable)])
         return List([item.key for item in pluggable_unstably_sorted(plugin, decorated_list)])
 
     return stabilized_pluggable_sorted
+
+
+def stabilize_pluggable_iter_sorted(pluggable_unstably_iter_sorted):
+    """Return generator function which applies Decorate+Sort+Undecorate around the argument function."""
+
+    def stabilized_pluggable_iter_sorted(plugin, source_iterable, unique=False):
+        """Decorate, iterate over pluggable_unstably_iter_sorted, yield undecorated items."""
+        if unique:
+            yield from pluggable_unstably_iter_sorted(plugin, source_iterable)
+            return
+        decorated_list = List([ComparableSecondary(key, index) for index, key in enumerate(source_iterable)])
+        for item in pluggable_unstably_iter_sorted(plugin, decorated_list):
+            yield item.key
+
+    return stabilized_pluggable_iter_sorted
@@ -0,0 +1,10 @@
+import asyncio
+
+from async_sorted import async_mslzph_sorted
+from pluggable_test import suite
+
+
+async def less_than(left, right):
+    return left < right
+
+suite(lambda source: asyncio.run(async_mslzph_sorted(source, less_than, concurrency_limit=4)))
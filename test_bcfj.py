@@ -0,0 +1,4 @@
+from blocked_complete_ford_johnson_sort import bcfj_sorted
+from pluggable_test import suite
+
+suite(bcfj_sorted, keyed=True)
@@ -1,4 +1,16 @@
+from functools import partial
+
+from blocked_list import BlockedList
+from complete_binary_insert import complete_pivot
 from complete_ford_johnson_sort import cfj_sorted
+from indexed_ford_johnson_sort import indexed_ford_johnson_sort
+from pluggable_test import counting_test
+from pluggable_test import journal_reopen_test
 from pluggable_test import suite
 
-suite(cfj_sorted)
+# Small blocks, so BlockedList targets (used by default only for long levels) split and relocate often.
+blocked_cfj_sorted = partial(indexed_ford_johnson_sort, complete_pivot, target_class=partial(BlockedList, block_size=4))
+for size in range(100):
+    assert counting_test(blocked_cfj_sorted, size) == counting_test(cfj_sorted, size)
+journal_reopen_test("complete_ford_johnson_sort", "cfj_sorted", 100)
+suite(cfj_sorted, keyed=True)
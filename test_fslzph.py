@@ -1,4 +1,74 @@
+import random
+
+from comparable_payload import ComparablePayload
+from functional_stable_lazy_zigzag_pairing_heap import FunctionalStableLazyZigzagPairingHeap
 from functional_stable_lazy_zigzag_pairing_heap import fslzph_sorted
+from functional_stable_lazy_zigzag_pairing_heap import fslzph_iter_sorted
+from functional_stable_lazy_zigzag_pairing_heap import fslzph_smallest
+from pep_3140 import List
+from persistent_deque import PersistentDeque
+from pluggable_test import streaming_test
 from pluggable_test import suite
 
-suite(fslzph_sorted)
+
+def persistent_deque_test(steps=1000, seed=42):
+    """Append to random old versions of PersistentDeque, check every version against its List."""
+    print(f"Persistent deque test with {steps} steps")
+    random.seed(seed)
+    versions = List([(PersistentDeque(), List())])
+    for step in range(steps):
+        deque, items = random.choice(versions)
+        if random.random() < 0.5:
+            versions.append((deque.append(step), items + [step]))
+        else:
+            versions.append((deque.appendleft(step), [step] + items))
+    versions.append((PersistentDeque(range(10)), List(range(10))))
+    for deque, items in versions:
+        assert List(deque) == items, str(deque)
+        assert len(deque) == len(items) and bool(deque) == bool(items), str(deque)
+
+
+def snapshot_test(steps=500, seed=42):
+    """Derive versions by add, peek, pop and merge of random old versions, then pop each version fully.
+
+    Items have duplicate keys, so stability is checked too, expected order is sorted() of version contents.
+    """
+    print(f"Snapshot test with {steps} steps")
+    random.seed(seed)
+    versions = List([(FunctionalStableLazyZigzagPairingHeap(), List())])
+    for step in range(steps):
+        heap, items = random.choice(versions)
+        action = random.random()
+        if action < 0.5:
+            item = ComparablePayload(random.randrange(20), step)
+            versions.append((heap.add(item), items + [item]))
+        elif action < 0.65:
+            heap, top = heap.peek()
+            assert top is (min(items) if items else None), str(top)
+            versions.append((heap, items))
+        elif action < 0.85:
+            heap, top = heap.pop()
+            assert top is (min(items) if items else None), str(top)
+            if top is not None:
+                # Merging a version with itself stores the same item twice, remove one occurrence.
+                index = next(index for index, item in enumerate(items) if item is top)
+                items = items[:index] + items[index + 1:]
+            versions.append((heap, items))
+        else:
+            other, other_items = random.choice(versions)
+            versions.append((heap.merge(other), items + other_items))
+    for heap, items in versions:
+        result = List()
+        while 1:
+            heap, item = heap.pop()
+            if item is None:
+                break
+            result.append(item.payload)
+        expected = List([item.payload for item in sorted(items)])
+        assert result == expected, str(result)
+
+
+persistent_deque_test()
+snapshot_test()
+streaming_test(fslzph_iter_sorted, fslzph_smallest)
+suite(fslzph_sorted, keyed=True)
@@ -1,4 +1,4 @@
 from halving_ford_johnson_sort import hfj_sorted
 from pluggable_test import suite
 
-suite(hfj_sorted)
+suite(hfj_sorted, keyed=True)
@@ -0,0 +1,37 @@
+from functional_stable_lazy_zigzag_pairing_heap import FunctionalStableLazyZigzagPairingHeap
+from keyed_sorted import keyed_sorted
+from pep_3140 import List
+from pluggable_test import suite
+
+
+@keyed_sorted
+def merged_fslzph_sorted(source):
+    source = List(source)
+    bounds = List([len(source) * part // 3 for part in range(4)])
+    shards = List()
+    for part in range(3):
+        shard = FunctionalStableLazyZigzagPairingHeap()
+        for item in source[bounds[part]:bounds[part + 1]]:
+            shard = shard.add(item)
+        shards.append(shard)
+    # Promote one shard, so both demoted and promoted heaps are merged.
+    shards[1], _ = shards[1].peek()
+    merged = FunctionalStableLazyZigzagPairingHeap()
+    for shard in shards:
+        merged = merged.merge(shard)
+    result = List()
+    while 1:
+        merged, item = merged.pop()
+        if item is None:
+            break
+        result.append(item)
+    return result
+
+
+# Merge is persistent, merged heaps still hold their items.
+former = FunctionalStableLazyZigzagPairingHeap().add(2).add(0)
+latter = FunctionalStableLazyZigzagPairingHeap().add(1)
+merged = former.merge(latter)
+assert merged_fslzph_sorted([2, 0, 1]) == [0, 1, 2]
+assert merged.pop()[1] == 0 and former.pop()[1] == 0 and latter.pop()[1] == 1
+suite(merged_fslzph_sorted, keyed=True)
@@ -1,4 +1,8 @@
 from mutable_inclusion_preferring_lazy_zigzag_pairing_heap import miplzph_sorted
+from mutable_inclusion_preferring_lazy_zigzag_pairing_heap import miplzph_iter_sorted
+from mutable_inclusion_preferring_lazy_zigzag_pairing_heap import miplzph_smallest
+from pluggable_test import streaming_test
 from pluggable_test import suite
 
-suite(miplzph_sorted)
+streaming_test(miplzph_iter_sorted, miplzph_smallest)
+suite(miplzph_sorted, keyed=True)
@@ -1,4 +1,8 @@
 from mutable_lazy_weight_linking_heap import mlwlh_sorted
+from mutable_lazy_weight_linking_heap import mlwlh_iter_sorted
+from mutable_lazy_weight_linking_heap import mlwlh_smallest
+from pluggable_test import streaming_test
 from pluggable_test import suite
 
-suite(mlwlh_sorted)
+streaming_test(mlwlh_iter_sorted, mlwlh_smallest)
+suite(mlwlh_sorted, keyed=True)
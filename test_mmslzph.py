@@ -0,0 +1,42 @@
+from keyed_sorted import keyed_sorted
+from mutable_stable_lazy_zigzag_pairing_heap import MutableStableLazyZigzagPairingHeap
+from pep_3140 import List
+from pluggable_test import suite
+
+
+@keyed_sorted
+def merged_mslzph_sorted(source):
+    source = List(source)
+    bounds = List([len(source) * part // 3 for part in range(4)])
+    shards = List([MutableStableLazyZigzagPairingHeap.from_iterable(source[bounds[part]:bounds[part + 1]]) for part in range(3)])
+    # Promote one shard, so both demoted and promoted heaps are merged.
+    shards[1].peek()
+    merged = MutableStableLazyZigzagPairingHeap()
+    for shard in shards:
+        merged.merge(shard)
+    result = List()
+    while 1:
+        item = merged.pop()
+        if item is None:
+            return result
+        result.append(item)
+
+
+def self_merge_test():
+    """Check merging heap with itself is rejected and keeps the items."""
+    print("Self merge test")
+    heap = MutableStableLazyZigzagPairingHeap.from_iterable([3, 1, 2])
+    for promoted in (False, True):
+        if promoted:
+            heap.peek()
+        try:
+            heap.merge(heap)
+            assert False, "Self merge not rejected."
+        except ValueError:
+            pass
+    result = List([heap.pop(), heap.pop(), heap.pop(), heap.pop()])
+    assert result == [1, 2, 3, None], str(result)
+
+
+self_merge_test()
+suite(merged_mslzph_sorted, keyed=True)
@@ -0,0 +1,8 @@
+from mutable_stable_arena_lazy_zigzag_pairing_heap import msalzph_sorted
+from mutable_stable_arena_lazy_zigzag_pairing_heap import msalzph_iter_sorted
+from mutable_stable_arena_lazy_zigzag_pairing_heap import msalzph_smallest
+from pluggable_test import streaming_test
+from pluggable_test import suite
+
+streaming_test(msalzph_iter_sorted, msalzph_smallest)
+suite(msalzph_sorted, keyed=True)
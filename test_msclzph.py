@@ -0,0 +1,11 @@
+from mutable_stable_counting_lazy_zigzag_pairing_heap import MutableStableCountingLazyZigzagPairingHeap
+from mutable_stable_counting_lazy_zigzag_pairing_heap import msclzph_sorted
+from mutable_stable_counting_lazy_zigzag_pairing_heap import msclzph_iter_sorted
+from mutable_stable_counting_lazy_zigzag_pairing_heap import msclzph_smallest
+from pluggable_test import decrease_key_test
+from pluggable_test import streaming_test
+from pluggable_test import suite
+
+decrease_key_test(MutableStableCountingLazyZigzagPairingHeap)
+streaming_test(msclzph_iter_sorted, msclzph_smallest)
+suite(msclzph_sorted, keyed=True)
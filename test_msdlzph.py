@@ -0,0 +1,37 @@
+from functools import partial
+
+from mutable_stable_deletable_lazy_zigzag_pairing_heap import MutableStableDeletableLazyZigzagPairingHeap
+from mutable_stable_deletable_lazy_zigzag_pairing_heap import msdlzph_sorted
+from mutable_stable_deletable_lazy_zigzag_pairing_heap import msdlzph_iter_sorted
+from mutable_stable_deletable_lazy_zigzag_pairing_heap import msdlzph_smallest
+from pluggable_test import deletable_test
+from pluggable_test import streaming_test
+from pluggable_test import suite
+from zigzag_pairing import sequential_oracle
+
+
+def compaction_test(size=1000, rounds=10):
+    """Cancel most items in rounds, check tombstones are purged so stored items stay bounded."""
+    print(f"Compaction test on length {size}")
+    heap = MutableStableDeletableLazyZigzagPairingHeap(compaction_fraction=0.25)
+    for round in range(rounds):
+        for value in range(size):
+            heap.add(round * size + value)
+        heap.peek()
+        for value in range(size - 1):
+            heap.delete(round * size + value + 1)
+        live = round + 1
+        assert heap.stored <= live + 0.25 * heap.stored + 1, str(heap.stored)
+    result = [heap.pop() for _ in range(rounds)]
+    assert result == [round * size for round in range(rounds)], str(result)
+    assert heap.pop() is None
+    assert heap.stored == 0, str(heap.stored)
+
+
+deletable_test(MutableStableDeletableLazyZigzagPairingHeap)
+deletable_test(partial(MutableStableDeletableLazyZigzagPairingHeap, compaction_fraction=0.1))
+deletable_test(partial(MutableStableDeletableLazyZigzagPairingHeap, compaction_fraction=0.0))
+deletable_test(partial(MutableStableDeletableLazyZigzagPairingHeap, oracle=sequential_oracle))
+compaction_test()
+streaming_test(msdlzph_iter_sorted, msdlzph_smallest)
+suite(msdlzph_sorted, keyed=True)
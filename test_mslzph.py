@@ -1,4 +1,13 @@
+from mutable_stable_lazy_zigzag_pairing_heap import MutableStableLazyZigzagPairingHeap
 from mutable_stable_lazy_zigzag_pairing_heap import mslzph_sorted
+from mutable_stable_lazy_zigzag_pairing_heap import mslzph_iter_sorted
+from mutable_stable_lazy_zigzag_pairing_heap import mslzph_smallest
+from pluggable_test import decrease_key_test
+from pluggable_test import streaming_test
+from pluggable_test import journal_reopen_test
 from pluggable_test import suite
 
-suite(mslzph_sorted)
+decrease_key_test(MutableStableLazyZigzagPairingHeap)
+streaming_test(mslzph_iter_sorted, mslzph_smallest)
+journal_reopen_test("mutable_stable_lazy_zigzag_pairing_heap", "mslzph_sorted", 100)
+suite(mslzph_sorted, keyed=True)
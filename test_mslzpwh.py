@@ -1,4 +1,42 @@
+from mutable_stable_lazy_zigzag_pairing_weak_heap import MutableStableLazyZigzagPairingWeakHeap
 from mutable_stable_lazy_zigzag_pairing_weak_heap import mslzpwh_sorted
+from mutable_stable_lazy_zigzag_pairing_weak_heap import mslzpwh_iter_sorted
+from mutable_stable_lazy_zigzag_pairing_weak_heap import mslzpwh_smallest
+from comparable_payload import ComparablePayload
+from pep_3140 import List
+from pluggable_test import streaming_test
 from pluggable_test import suite
 
-suite(mslzpwh_sorted)
+
+def churn_test(size=10000, window=100, seed=42):
+    """Add short-lived items keeping only a window alive, check pops and that dead sub-heaps are pruned."""
+    print(f"Churn test on length {size}")
+    heap = MutableStableLazyZigzagPairingWeakHeap(compaction_fraction=0.25)
+    alive = List()
+    for index in range(size):
+        alive.append(ComparablePayload((index * 7919 + seed) % size, index))
+        heap.add(alive[-1])
+        if len(alive) > window:
+            del alive[0]
+        if index % 10 == 0:
+            item = heap.pop()
+            expected = min(alive, key=lambda element: (element.key, element.payload))
+            assert item is expected, str(item)
+            alive.remove(item)
+        assert heap.stored <= 2 * window, str(heap.stored)
+    alive.sort(key=lambda element: (element.key, element.payload))
+    result = List()
+    while 1:
+        item = heap.pop()
+        if item is None:
+            break
+        result.append(item)
+    assert result == alive, str(result)
+    del alive, result, item
+    assert heap.pop() is None
+    assert heap.stored == 0 and heap.tombstones.count == 0, str(heap.stored)
+
+
+churn_test()
+streaming_test(mslzpwh_iter_sorted, mslzpwh_smallest)
+suite(mslzpwh_sorted, keyed=True)
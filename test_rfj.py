@@ -1,4 +1,14 @@
+from functools import partial
+
+from blocked_list import BlockedList
+from complete_binary_insert import complete_pivot
+from indexed_reordered_ford_johnson_sort import indexed_reordered_ford_johnson_sort
 from reordered_ford_johnson_sort import rfj_sorted
+from pluggable_test import counting_test
 from pluggable_test import suite
 
-suite(rfj_sorted)
+# Small blocks, so BlockedList targets (used by default only for long levels) split and relocate often.
+blocked_rfj_sorted = partial(indexed_reordered_ford_johnson_sort, complete_pivot, target_class=partial(BlockedList, block_size=4))
+for size in range(100):
+    assert counting_test(blocked_rfj_sorted, size) == counting_test(rfj_sorted, size)
+suite(rfj_sorted, keyed=True)
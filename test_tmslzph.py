@@ -0,0 +1,17 @@
+from functools import partial
+
+from complete_binary_insert import complete_pivot
+from complete_ford_johnson_sort import cfj_sorted
+from indexed_ford_johnson_sort import indexed_ford_johnson_sort
+from mutable_stable_lazy_zigzag_pairing_heap import MutableStableLazyZigzagPairingHeap
+from pluggable_test import counting_test
+from pluggable_test import suite
+from sorted_using_heap import sorted_using_mutable_stable_heap
+from thread_pool_oracle import ThreadPoolOracle
+
+with ThreadPoolOracle(max_workers=4) as oracle:
+    # Pairing levels of Ford-Johnson are batched to the oracle, counts match the sequential sort.
+    pooled_cfj_sorted = partial(indexed_ford_johnson_sort, complete_pivot, oracle=oracle)
+    for size in range(100):
+        assert counting_test(pooled_cfj_sorted, size) == counting_test(cfj_sorted, size)
+    suite(partial(sorted_using_mutable_stable_heap, partial(MutableStableLazyZigzagPairingHeap, oracle=oracle)))
@@ -0,0 +1,58 @@
+"""Module that defines ThreadPoolOracle, evaluating batches of comparisons in parallel threads.
+
+This only helps comparisons that release the GIL (network, subprocess and similar).
+Comparisons of a batch run concurrently, so they have to be thread-safe,
+ComparisonCountingWrapper is, as its counter increments under a lock.
+See zigzag_pairing for the oracle interface.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pep_3140 import List
+
+
+def _less_than(pair):
+    """Return result of less-than on (left, right) pair."""
+    left, right = pair
+    return left < right
+
+
+class ThreadPoolOracle(object):
+    """Oracle dispatching comparisons of a batch to ThreadPoolExecutor.
+
+    Batches smaller than min_batch_size are evaluated in the calling thread,
+    as for them the dispatch overhead would outweigh the parallelism.
+    Can be used as a context manager, shutting the executor down on exit.
+    """
+
+    def __init__(self, max_workers=None, min_batch_size=2, executor=None):
+        """Use given executor, or create ThreadPoolExecutor with max_workers."""
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers=max_workers)
+        self.min_batch_size = min_batch_size
+
+    def __call__(self, pairs):
+        """Return List of less-than results for (left, right) Tuples, in the same order."""
+        if len(pairs) < self.min_batch_size:
+            return List([left < right for left, right in pairs])
+        return List(self.executor.map(_less_than, pairs))
+
+    def shutdown(self):
+        """Shut the executor down, waiting for pending comparisons."""
+        self.executor.shutdown()
+
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shut the executor down, do not suppress exceptions."""
+        self.shutdown()
+        return False
+
+    def __str__(self):
+        """Return class name followed by str of executor in parentheses."""
+        return "ThreadPoolOracle(" + str(self.executor) + ")"
+
+    def __repr__(self):
+        """Return constructor-like string."""
+        return "ThreadPoolOracle(min_batch_size=" + repr(self.min_batch_size) + ", executor=" + repr(self.executor) + ")"
@@ -0,0 +1,70 @@
+"""Script comparing memory and comparison speed of slotted wrappers against dict-backed equivalents.
+
+The dict-backed reference classes reuse methods of the tested class except rich comparisons
+other than __eq__ and __lt__, getting those from functools.total_ordering,
+as the tested classes did before switching to __slots__.
+"""
+
+import sys
+import time
+import tracemalloc
+from functools import total_ordering
+
+from pep_3140 import List
+from comparable_payload import ComparablePayload
+from comparable_secondary import ComparableSecondary
+from comparison_counting_wrapper import ComparisonCountingWrapper
+from comparison_counting_wrapper import SimpleCounter
+from comparison_logging_wrapper import ComparisonLoggingWrapper
+
+
+def dict_backed(tested_class):
+    """Return total_ordering class with __dict__, sharing methods but not slots with tested_class."""
+    excluded = set(tested_class.__slots__) | {"__slots__", "__ne__", "__le__", "__gt__", "__ge__"}
+    methods = {name: value for name, value in vars(tested_class).items() if name not in excluded}
+    return total_ordering(type("DictBacked" + tested_class.__name__, (object,), methods))
+
+
+def measure_memory(constructor, length):
+    """Return instances created by constructor(index) and bytes allocated per instance."""
+    tracemalloc.start()
+    instances = List([constructor(index) for index in range(length)])
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return instances, allocated / length
+
+
+def measure_greater_than(instances):
+    """Return seconds per greater-than comparison of neighbouring instances."""
+    time_start = time.perf_counter()
+    for former, latter in zip(instances, instances[1:]):
+        former > latter
+    time_stop = time.perf_counter()
+    return (time_stop - time_start) / (len(instances) - 1)
+
+
+class SilentLog(object):
+    """A log object ignoring all messages."""
+
+    def info(self, *args):
+        """Ignore the message."""
+        pass
+
+
+counter = SimpleCounter()
+silent_log = SilentLog()
+benchmarks_input = (
+    (ComparablePayload, lambda tested_class: lambda index: tested_class(index, None)),
+    (ComparableSecondary, lambda tested_class: lambda index: tested_class(index, index)),
+    (ComparisonCountingWrapper, lambda tested_class: lambda index: tested_class(index, counter)),
+    (ComparisonLoggingWrapper, lambda tested_class: lambda index: tested_class(index, silent_log)),
+)
+
+length = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+print(f"Benchmarking on {length} instances")
+for tested_class, constructor_factory in benchmarks_input:
+    for measured_class in (dict_backed(tested_class), tested_class):
+        instances, memory = measure_memory(constructor_factory(measured_class), length)
+        seconds = measure_greater_than(instances)
+        del instances
+        print(f"{measured_class.__name__}: {memory:.1f} bytes per instance, {seconds * 1e9:.1f} ns per greater-than")
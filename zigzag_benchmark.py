@@ -0,0 +1,68 @@
+"""Script measuring allocations and time of the first pop (promotion of the whole forest) of zigzag heaps.
+
+The in-place passes of zigzag_pairing (reusing the forest Deque) are compared
+against the previous implementation, which built a new Deque for every zig and every zag pass.
+Reported is tracemalloc peak (in bytes above the filled heap) and untraced time, both per sub-heap.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from pep_3140 import Deque
+from mutable_stable_lazy_zigzag_pairing_heap import MutableStableLazyZigzagPairingHeap
+from zigzag_pairing import zigzag_promoted
+
+
+def deque_zigzag_promoted(forest, oracle=None):
+    """Link sub-heaps of nonempty forest, building a new Deque for every pass, return the remaining sub-heap."""
+    while len(forest) > 1:
+        # zig
+        new_forest = Deque()
+        while len(forest) > 1:
+            latter = forest.pop()
+            former = forest.pop()
+            new_forest.appendleft(former._link_with(latter, latter.top_item < former.top_item))
+        if forest:
+            new_forest.appendleft(forest.pop())
+        forest = new_forest
+        # zag
+        new_forest = Deque()
+        while len(forest) > 1:
+            former = forest.popleft()
+            latter = forest.popleft()
+            new_forest.append(former._link_with(latter, latter.top_item < former.top_item))
+        if forest:
+            new_forest.append(forest.pop())
+        forest = new_forest
+    return forest.pop()
+
+
+def measure_promotion(promoted, length):
+    """Return peak traced bytes and seconds of promoting forest of length singleton sub-heaps."""
+    heap = MutableStableLazyZigzagPairingHeap.from_iterable(range(length, 0, -1))
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    time_start = time.perf_counter()
+    promoted(heap.forest)
+    time_stop = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, time_stop - time_start
+
+
+def measure_untraced(promoted, length):
+    """Return seconds of promoting forest of length singleton sub-heaps, without tracing."""
+    heap = MutableStableLazyZigzagPairingHeap.from_iterable(range(length, 0, -1))
+    time_start = time.perf_counter()
+    promoted(heap.forest)
+    return time.perf_counter() - time_start
+
+
+max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+for exponent in range(3, max_exponent + 1):
+    length = 10 ** exponent
+    for name, promoted in (("deque passes", deque_zigzag_promoted), ("in-place passes", zigzag_promoted)):
+        peak, _ = measure_promotion(promoted, length)
+        seconds = measure_untraced(promoted, length)
+        print(f"{length} sub-heaps, {name}: peak {peak / length:.1f} bytes per sub-heap, {seconds * 1e6 / length:.2f} us per sub-heap")
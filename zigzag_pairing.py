@@ -0,0 +1,167 @@
+"""Module that defines zigzag pairing passes shared by mutable zigzag pairing heaps.
+
+Comparisons within one zig (or zag) pass are independent of each other,
+so they can be handed to a batched comparison oracle at once.
+Oracle is a callable taking List of (left, right) Tuples
+and returning List of booleans, the results of left < right in the same order.
+
+Handle support (decrease_key and vacated sub-heaps) is shared too, see HandledZigzagHeapMixin.
+"""
+
+from heap_handle import HeapHandle
+from pep_3140 import Deque
+from pep_3140 import List
+from pep_3140 import Tuple
+
+
+def sequential_oracle(pairs):
+    """Return List of less-than results for (left, right) Tuples, evaluated one by one in order."""
+    return List([left < right for left, right in pairs])
+
+
+def singleton_forest(new_heap, items):
+    """Return Deque of singleton sub-heaps new_heap(item) for items, in order."""
+    return Deque([new_heap(item) for item in items])
+
+
+def _zig_in_place(forest, oracle):
+    """Do zig pass (pairs from the end, odd sub-heap left at start) in place.
+
+    Pairs are popped from the end and linked sub-heaps are put to the start,
+    so after all pairs are done, only the odd sub-heap (if any) needs moving.
+    """
+    len_pairs = len(forest) // 2
+    if oracle is None:
+        for _ in range(len_pairs):
+            latter = forest.pop()
+            former = forest.pop()
+            forest.appendleft(former._link_with(latter, latter.top_item < former.top_item))
+    else:
+        pairs = List()
+        for _ in range(len_pairs):
+            latter = forest.pop()
+            former = forest.pop()
+            pairs.append(Tuple((former, latter)))
+        results = oracle(List([Tuple((latter.top_item, former.top_item)) for former, latter in pairs]))
+        for (former, latter), latter_less in zip(pairs, results):
+            forest.appendleft(former._link_with(latter, latter_less))
+    if len(forest) > len_pairs:
+        forest.appendleft(forest.pop())
+
+
+def _zag_in_place(forest, oracle):
+    """Do zag pass (pairs from the start, odd sub-heap left at end) in place.
+
+    Pairs are popped from the start and linked sub-heaps are put to the end,
+    so after all pairs are done, only the odd sub-heap (if any) needs moving.
+    """
+    len_pairs = len(forest) // 2
+    if oracle is None:
+        for _ in range(len_pairs):
+            former = forest.popleft()
+            latter = forest.popleft()
+            forest.append(former._link_with(latter, latter.top_item < former.top_item))
+    # After zig, there may be nothing to compare.
+    elif len_pairs:
+        pairs = List()
+        for _ in range(len_pairs):
+            former = forest.popleft()
+            latter = forest.popleft()
+            pairs.append(Tuple((former, latter)))
+        results = oracle(List([Tuple((latter.top_item, former.top_item)) for former, latter in pairs]))
+        for (former, latter), latter_less in zip(pairs, results):
+            forest.append(former._link_with(latter, latter_less))
+    if len(forest) > len_pairs:
+        forest.append(forest.popleft())
+
+
+def zigzag_promoted(forest, oracle=None):
+    """Link sub-heaps of nonempty forest in zigzag passes, return the single remaining sub-heap.
+
+    Forest is Deque of nonempty sub-heaps with top promoted, it is used as the only buffer and emptied.
+    Former._link_with(latter, latter_less) includes one sub-heap into the other, returning the including one.
+    Without oracle, comparisons are done one by one, in the same order as an oracle would see them.
+    """
+    while len(forest) > 1:
+        _zig_in_place(forest, oracle)
+        _zag_in_place(forest, oracle)
+    return forest.pop()
+
+
+class HandledZigzagHeapMixin(object):
+    """Mixin implementing add with handles, decrease_key and top promotion for mutable zigzag pairing heaps.
+
+    Class provides _singleton(item) returning new sub-heap holding only the item,
+    ensure_top_demoted, _include_after, and instances with top_item, forest Deque of sub-heaps,
+    oracle, top_node (initially None) and vacated (initially 0).
+
+    Decrease_key moves the item into a new sub-heap.
+    The old sub-heap is left vacated (top_item None) and replaced by its sub-heaps
+    only when it reaches the top level forest, the heap used as a queue counts vacated sub-heaps.
+    Sub-heap which lost its item to the top is kept as top_node, so handles stay valid.
+    """
+
+    def add(self, item, with_handle=False):
+        """Add item to self, prioritized after current items, do not compare yet.
+
+        If with_handle, return HeapHandle usable for decrease_key.
+        """
+        self.ensure_top_demoted()
+        node = self._singleton(item)
+        self._include_after(node)
+        if with_handle:
+            return HeapHandle(node)
+
+    def decrease_key(self, handle, new_item):
+        """Replace item referenced by handle with new_item, which must not be greater, do not compare yet.
+
+        New item is prioritized after current items, as if the old one was deleted and new added,
+        unless the old item is the promoted top, which stays the top.
+        """
+        node = handle.node
+        if node is self.top_node:
+            self.top_item = node.top_item = new_item
+            return
+        if node.top_item is None:
+            raise ValueError(type(self).__name__ + ": decrease_key of item not in heap.")
+        # Vacated sub-heap keeps its sub-heaps (and length, if counted), until spliced out.
+        node.top_item = None
+        self.vacated += 1
+        self.ensure_top_demoted()
+        handle.node = self._singleton(new_item)
+        # Not _include_after, the item count is unchanged.
+        self.forest.append(handle.node)
+
+    def _release_top_node(self):
+        """Mark sub-heap of the extracted top as no longer holding an item, so its handle is rejected."""
+        if self.top_node is not None:
+            self.top_node.top_item = None
+            self.top_node = None
+
+    def _splice_vacated(self):
+        """Replace vacated sub-heaps of forest by their sub-heaps, keeping forest order."""
+        old_forest = self.forest
+        new_forest = Deque()
+        while old_forest:
+            tree = old_forest.popleft()
+            if tree.top_item is None:
+                self.vacated -= 1
+                # Included sub-heaps were not less than the old item, so they can take its place.
+                old_forest.extendleft(reversed(tree.forest))
+                continue
+            new_forest.append(tree)
+        self.forest = new_forest
+
+    # TODO: Merge this into peek(), weak heaps suggest that makes things faster. Or is it not bothering with len?
+    def ensure_top_promoted(self):
+        """Do pairwise includes in zigzag fashion until there is only one tree. Then upgrade."""
+        if self.top_item is not None:
+            return
+        if self.vacated:
+            self._splice_vacated()
+        if not self.forest:
+            return
+        new_state = zigzag_promoted(self.forest, self.oracle)
+        self.top_item = new_state.top_item
+        self.forest = new_state.forest
+        self.top_node = new_state